@@ -0,0 +1,141 @@
+import logging
+import random
+import threading
+import time
+
+from . import config_manager
+from inc.helpers import t
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_BASE_DELAY_SECONDS = 30
+DEFAULT_MAX_DELAY_SECONDS = 1800
+# A probe that never reports back (e.g. it crashed) doesn't keep the breaker half-open forever
+PROBE_TIMEOUT_SECONDS = 60
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+class CircuitBreaker:
+    """
+    Stops requests to an endpoint after repeated failures. While open, requests are
+    skipped until a randomised, exponentially growing delay has passed; then a single
+    probe request is let through and its result closes or re-opens the breaker.
+    """
+
+    def __init__(self, name, failure_threshold, base_delay, max_delay):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.state = CLOSED
+        self.failures = 0
+        self.open_count = 0 # Consecutive openings, drives the backoff
+        self.retry_at = 0.0
+        self.probe_started = 0.0
+        self.lock = threading.Lock()
+
+    def allow_request(self):
+        """True if a request may be made now. In the open state the first caller after the delay becomes the probe."""
+        with self.lock:
+            now = time.time()
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and now >= self.retry_at:
+                self.state = HALF_OPEN
+                self.probe_started = now
+                return True
+            if self.state == HALF_OPEN and now - self.probe_started > PROBE_TIMEOUT_SECONDS:
+                self.probe_started = now
+                return True
+            return False
+
+    def is_blocking(self):
+        """True while requests would be skipped, without claiming the probe."""
+        with self.lock:
+            now = time.time()
+            if self.state == OPEN:
+                return now < self.retry_at
+            if self.state == HALF_OPEN:
+                return now - self.probe_started <= PROBE_TIMEOUT_SECONDS
+            return False
+
+    def record_success(self):
+        with self.lock:
+            if self.state != CLOSED:
+                logging.info(f"Circuit '{self.name}' closed")
+            self.state = CLOSED
+            self.failures = 0
+            self.open_count = 0
+
+    def record_failure(self):
+        with self.lock:
+            if self.state == OPEN:
+                return # Requests sent before it opened; only a failed probe escalates the backoff
+            self.failures += 1
+            if self.state == CLOSED and self.failures < self.failure_threshold:
+                return
+            delay = min(self.max_delay, self.base_delay * 2 ** self.open_count)
+            # Jitter keeps endpoints that failed together from retrying in lockstep
+            delay = random.uniform(delay / 2, delay)
+            self.open_count += 1
+            self.state = OPEN
+            self.retry_at = time.time() + delay
+            logging.info(f"Circuit '{self.name}' open, retrying in {delay:.0f} s")
+
+    def record_error(self, e):
+        """Records a failed request: a failure if is_outage(e), otherwise the endpoint still answered."""
+        if is_outage(e):
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def reset(self):
+        """Closes the breaker at once, e.g. after a new login made the old failures irrelevant."""
+        with self.lock:
+            self.state = CLOSED
+            self.failures = 0
+            self.open_count = 0
+
+    def status_text(self):
+        """One line for the permanent notification line, or None while closed."""
+        with self.lock:
+            if self.state == OPEN:
+                return t('circuit_open', name=self.name, seconds=max(0, int(self.retry_at - time.time())))
+            if self.state == HALF_OPEN:
+                return t('circuit_probing', name=self.name)
+            return None
+
+
+def get_breaker(name):
+    """The breaker shared by everything calling the named endpoint."""
+    with _breakers_lock:
+        if name not in _breakers:
+            config = config_manager.config
+            _breakers[name] = CircuitBreaker(
+                name,
+                config.get("CIRCUIT_BREAKER_FAILURE_THRESHOLD", DEFAULT_FAILURE_THRESHOLD),
+                config.get("CIRCUIT_BREAKER_BASE_DELAY_SECONDS", DEFAULT_BASE_DELAY_SECONDS),
+                config.get("CIRCUIT_BREAKER_MAX_DELAY_SECONDS", DEFAULT_MAX_DELAY_SECONDS))
+        return _breakers[name]
+
+
+def is_outage(e):
+    """
+    True if a requests exception means the endpoint itself is unusable: no response,
+    auth failures, rate limiting or server errors. Other 4xx (e.g. one deleted PR) don't count.
+    """
+    response = getattr(e, 'response', None)
+    if response is None:
+        return True
+    return response.status_code in (401, 403, 429) or response.status_code >= 500
+
+
+def breaker_status_lines():
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return [text for text in (breaker.status_text() for breaker in breakers) if text]
@@ -23,7 +23,41 @@ def load_config():
         "BROWSER_COMMAND": ["/usr/bin/google-chrome", "--profile-directory=Profile 1", "--new-window"],
         "JIRA_URL": "https://YOUR_ORG.atlassian.net",
         "JIRA_SESSION_FILE": "jira_session.pkl",
-        "CHROME_DRIVER_PATH": "path/to/your/chromedriver"
+        "CHROME_DRIVER_PATH": "path/to/your/chromedriver",
+        "JIRA_FIELDS": ["status", "summary"],
+        "JIRA_CACHE_MAX_ENTRIES": 500,
+        "JIRA_BATCH_SIZE": 50,
+        "JIRA_POOL_SIZE": 5,
+        "JIRA_WORKER_COUNT": 3,
+        "JIRA_RATE_LIMIT_PER_SECOND": 5,
+        "JIRA_RATE_LIMIT_BURST": 10,
+        "JIRA_SYNC_INTERVAL_SECONDS": 60,
+        "JIRA_CACHE_TTL_SECONDS": 600,
+        "JIRA_STATUS_TTL_SECONDS": {"Done": 21600, "Closed": 21600, "Resolved": 21600, "Backlog": 7200},
+        "JIRA_REMOTELINK_TTL_SECONDS": 3600,
+        "JIRA_REMOTELINK_PREFETCH_NEIGHBOURS": True,
+        "JIRA_LOOKUP_TIMEOUT_SECONDS": 2,
+        "PR_POLL_WORKERS": 8,
+        "STASH_MAX_CONNECTIONS": 4,
+        "PR_POLL_MIN_SECONDS": 60,
+        "PR_POLL_MAX_SECONDS": 3600,
+        "PR_POLL_DEFAULT_SECONDS": 300,
+        "PR_POLL_BACKOFF_FACTOR": 0.1,
+        "PR_ACTIVITY_PAGE_SIZE": 25,
+        "PR_DASHBOARD_CHANGE_DETECTION": True,
+        "WEBHOOK_ENABLED": False,
+        "WEBHOOK_HOST": "127.0.0.1",
+        "WEBHOOK_PORT": 8765,
+        "WEBHOOK_SECRET": "",
+        "WEBHOOK_RECONCILE_SECONDS": 1800,
+        "CIRCUIT_BREAKER_FAILURE_THRESHOLD": 3,
+        "CIRCUIT_BREAKER_BASE_DELAY_SECONDS": 30,
+        "CIRCUIT_BREAKER_MAX_DELAY_SECONDS": 1800,
+        "STORAGE_BACKEND": "json",
+        "DATA_JOURNAL": True,
+        "DATA_JOURNAL_MAX_BYTES": 1048576,
+        "SAVE_DEBOUNCE_SECONDS": 1.0,
+        "DATA_BACKUP_COUNT": 3
     }
     try:
         with open(config_path, 'r', encoding='utf-8') as f:
@@ -1,15 +1,23 @@
 import os
+import json
 import pickle
+import sqlite3
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import copy
 import threading
 import logging
-import sys
 import queue
+import math
+import itertools
+import re
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from urllib.parse import urlparse
 
 from . import config_manager
-from inc.helpers import get_jira_ticket_from_url, t
+from inc.circuit_breaker import get_breaker
+from inc.helpers import t
 
 LOG_FILE = os.path.join(
     os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)),
@@ -22,16 +30,78 @@ logging.basicConfig(filename=LOG_FILE,
                     datefmt='%Y-%m-%d %H:%M:%S',
                     level=logging.DEBUG)
 
-jira_request_queue = queue.Queue()
-jira_in_flight = set() # To track tasks currently in the queue or being fetched
+# Fetch priorities, lowest first: the selected ticket, tickets shown in the current project,
+# then idle-time prefetch of paused projects
+PRIORITY_SELECTED = 0
+PRIORITY_VISIBLE = 1
+PRIORITY_PREFETCH = 2
+
+jira_request_queue = queue.PriorityQueue() # (priority, sequence, issue_id)
+# Issues queued or being fetched -> Future resolved with the new cache entry (None if the fetch failed)
+jira_in_flight = {}
+jira_queued_priority = {} # Issues still waiting in the queue -> best priority they were requested at
+jira_in_flight_lock = threading.Lock() # Guards jira_in_flight and jira_queued_priority
+_request_sequence = itertools.count() # Keeps FIFO order within one priority
 
 jira_cache = {}
 jira_cache_lock = threading.Lock()
+# Remote links are cached apart from the issues and only fetched for the selected ticket
+remotelink_cache = {} # issue_id -> {'links': [...], 'timestamp': ...}
+remotelink_cache_lock = threading.Lock()
+remotelink_request_queue = queue.Queue()
+remotelink_in_flight = set() # Guarded by remotelink_cache_lock
+_remotelink_store_misses = set()
 config_manager.load_config()
 config = config_manager.config
 
 SCRIPT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+# Legacy single-pickle cache, imported into JIRA_CACHE_DB once
 JIRA_CACHE_FILE = os.path.join(SCRIPT_DIR, "jira_cache.pkl")
+JIRA_CACHE_DB = os.path.join(SCRIPT_DIR, "jira_cache.db")
+
+_store_connection = None
+_store_lock = threading.Lock()
+_store_misses = set() # Keys known not to be on disk, so the renderer doesn't query them every frame
+_store_writes_since_prune = 0
+# Keys a successful search didn't return (deleted, moved, no access) -> when; see JiraCachePolicy.is_stale()
+_jira_not_found = {}
+referenced_jira_keys = None # Issues still used by some project, paused project or completed project
+# Incremental sync state, see jira_sync_worker()
+_last_sync_time = None # Start of the last complete sync; everything in _synced_keys is current as of then
+_synced_keys = set()
+
+DEFAULT_JIRA_FIELDS = ["status", "summary"]
+DEFAULT_JIRA_CACHE_MAX_ENTRIES = 500
+DEFAULT_JIRA_BATCH_SIZE = 50
+DEFAULT_JIRA_POOL_SIZE = 5
+DEFAULT_JIRA_WORKER_COUNT = 3
+DEFAULT_JIRA_RATE_LIMIT_PER_SECOND = 5
+DEFAULT_JIRA_RATE_LIMIT_BURST = 10
+DEFAULT_JIRA_SYNC_INTERVAL_SECONDS = 60
+DEFAULT_JIRA_CACHE_TTL_SECONDS = 600
+DEFAULT_JIRA_REMOTELINK_TTL_SECONDS = 3600
+DEFAULT_JIRA_LOOKUP_TIMEOUT_SECONDS = 2
+# Issues that rarely change are revalidated less often; keys are Jira status names, case-insensitive
+DEFAULT_JIRA_STATUS_TTL_SECONDS = {
+    "Done": 6 * 3600,
+    "Closed": 6 * 3600,
+    "Resolved": 6 * 3600,
+    "Backlog": 2 * 3600,
+}
+# Overlap added to every "updated since" query, for clock skew and Jira's minute resolution
+JIRA_SYNC_OVERLAP_SECONDS = 120
+
+# One keep-alive session shared by every Jira request, see get_jira_session()
+_jira_session = None
+_jira_session_mtime = None
+_jira_session_lock = threading.Lock()
+# Circuit breaker names, also shown in the notification line while open
+JIRA_SEARCH_ENDPOINT = "Jira"
+JIRA_REMOTELINK_ENDPOINT = "Jira remote links"
+# Anything else (e.g. a browse URL with a query or fragment left on) would break the JQL of a whole batch
+JIRA_KEY_PATTERN = re.compile(r"^[A-Z][A-Z0-9_]*-\d+$")
+# The one remote link the UI shows
+VF_REMOTE_LINK_ID = "VF - Log Hours"
 
 try:
     from selenium import webdriver
@@ -92,107 +162,710 @@ def get_and_save_jira_session(permanent_notifications_ref):
 
 
 
-def load_jira_cache():
-    """Loads the Jira cache from a file on startup and returns it."""
+def _get_store():
+    global _store_connection
+    if _store_connection is None:
+        _store_connection = sqlite3.connect(JIRA_CACHE_DB, check_same_thread=False)
+        _store_connection.execute("PRAGMA journal_mode=WAL")
+        _store_connection.execute("CREATE TABLE IF NOT EXISTS issues (key TEXT PRIMARY KEY, entry TEXT NOT NULL, timestamp REAL)")
+        _store_connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        _store_connection.execute("CREATE TABLE IF NOT EXISTS remotelinks (key TEXT PRIMARY KEY, entry TEXT NOT NULL, timestamp REAL)")
+    return _store_connection
+
+
+def _import_legacy_cache():
+    """Moves the old whole-dict jira_cache.pkl into the per-issue store, once."""
     try:
         with open(JIRA_CACHE_FILE, 'rb') as f:
-            return pickle.load(f)
-    except (FileNotFoundError, EOFError, pickle.UnpicklingError):
-        # File doesn't exist or is empty/corrupt, start with an empty cache.
+            legacy_cache = pickle.load(f)
+    except FileNotFoundError:
+        return
+    except (EOFError, pickle.UnpicklingError):
+        legacy_cache = {}
+    for issue_id, entry in legacy_cache.items():
+        save_cached_issue(issue_id, entry)
+    os.remove(JIRA_CACHE_FILE)
+    logging.info(f"Imported {len(legacy_cache)} issues from {JIRA_CACHE_FILE}")
+
+
+def load_jira_cache():
+    """Prepares the on-disk cache and returns the (empty) in-memory cache.
+
+    Entries are read from disk per key on first use, see get_cached_issue().
+    """
+    try:
+        with _store_lock:
+            _get_store()
+        _import_legacy_cache()
+    except (sqlite3.Error, IOError) as e:
+        logging.error(f"Jira cache store unavailable: {e}")
+    return {}
+
+
+def load_cached_issue(issue_id):
+    try:
+        with _store_lock:
+            row = _get_store().execute("SELECT entry FROM issues WHERE key = ?", (issue_id,)).fetchone()
+    except sqlite3.Error as e:
+        logging.error(f"Jira cache read failed for {issue_id}: {e}")
+        return None
+    return json.loads(row[0]) if row else None
+
+
+def load_cached_issues(issue_ids):
+    """Reads many issues from the on-disk cache in one query. Returns {issue_id: entry}."""
+    issue_ids = list(issue_ids)
+    if not issue_ids:
+        return {}
+    try:
+        with _store_lock:
+            rows = _get_store().execute(
+                f"SELECT key, entry FROM issues WHERE key IN ({','.join('?' * len(issue_ids))})", issue_ids).fetchall()
+    except sqlite3.Error as e:
+        logging.error(f"Jira cache read failed: {e}")
         return {}
+    return {key: json.loads(entry) for key, entry in rows}
 
-def save_jira_cache(cache_to_save, lock_to_use):
-    """Saves the provided cache object to a file using the provided lock."""
-    with lock_to_use:
-        try:
-            with open(JIRA_CACHE_FILE, 'wb') as f:
-                pickle.dump(cache_to_save, f)
-        except IOError:
-            logging.info(f"File save failed: {JIRA_CACHE_FILE}")
-            pass
 
-def get_jira_issue_details(issue_id, permanent_notifications_ref):
-    global config
-    logging.info(f"Get jira issue {issue_id}")
+def save_cached_issue(issue_id, entry):
+    """Writes a single issue to the on-disk cache."""
+    global _store_writes_since_prune
+    try:
+        with _store_lock:
+            conn = _get_store()
+            with conn:
+                conn.execute("INSERT INTO issues (key, entry, timestamp) VALUES (?, ?, ?) "
+                             "ON CONFLICT (key) DO UPDATE SET entry = excluded.entry, timestamp = excluded.timestamp",
+                             (issue_id, json.dumps(entry), entry.get('timestamp')))
+        _store_misses.discard(issue_id)
+        _store_writes_since_prune += 1
+    except (sqlite3.Error, TypeError) as e:
+        logging.info(f"Jira cache save failed for {issue_id}: {e}")
+
+
+def set_referenced_jira_keys(keys):
+    """Tells the cache which issues are still in use; everything else may be evicted."""
+    global referenced_jira_keys
+    referenced_jira_keys = set(keys)
+
+
+def prune_jira_cache(cache_ref, lock_ref):
+    """Evicts unreferenced issues, then the least recently refreshed ones above JIRA_CACHE_MAX_ENTRIES."""
+    global _store_writes_since_prune
+    max_entries = config.get("JIRA_CACHE_MAX_ENTRIES", DEFAULT_JIRA_CACHE_MAX_ENTRIES)
+    referenced = referenced_jira_keys
+    if referenced is None:
+        return # Nothing is known to be unused until the app has reported what it references
+    try:
+        with _store_lock:
+            conn = _get_store()
+            rows = conn.execute("SELECT key FROM issues ORDER BY timestamp DESC").fetchall()
+            kept = [key for (key,) in rows if key in referenced][:max_entries]
+            evicted = {key for (key,) in rows} - set(kept)
+            if evicted:
+                with conn:
+                    conn.executemany("DELETE FROM issues WHERE key = ?", [(key,) for key in evicted])
+            with conn:
+                conn.execute("DELETE FROM remotelinks WHERE key NOT IN (SELECT key FROM issues)")
+            _store_writes_since_prune = 0
+    except sqlite3.Error as e:
+        logging.error(f"Jira cache prune failed: {e}")
+        return
+    with lock_ref:
+        for key in list(cache_ref):
+            if key in evicted or key not in referenced:
+                del cache_ref[key]
+    with remotelink_cache_lock:
+        for key in list(remotelink_cache):
+            if key in evicted or key not in referenced:
+                del remotelink_cache[key]
+    if evicted:
+        logging.info(f"Evicted {len(evicted)} issues from the Jira cache")
+
+
+def _load_sync_state():
+    """Returns (last sync time, keys it covered) as saved by _save_sync_state(), or (None, set())."""
+    try:
+        with _store_lock:
+            rows = dict(_get_store().execute("SELECT key, value FROM meta WHERE key IN ('last_sync', 'synced_keys')"))
+    except sqlite3.Error as e:
+        logging.error(f"Jira cache read failed for last sync time: {e}")
+        return None, set()
+    if 'last_sync' not in rows or 'synced_keys' not in rows:
+        # Without the key set the time says nothing about any particular issue
+        return None, set()
+    return float(rows['last_sync']), set(json.loads(rows['synced_keys']))
+
+
+def _save_sync_state(sync_time, synced_keys):
+    try:
+        with _store_lock:
+            conn = _get_store()
+            with conn:
+                conn.executemany("INSERT INTO meta (key, value) VALUES (?, ?) "
+                                 "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+                                 [('last_sync', str(sync_time)), ('synced_keys', json.dumps(sorted(synced_keys)))])
+    except sqlite3.Error as e:
+        logging.error(f"Jira cache save failed for last sync time: {e}")
+
+
+class JiraCachePolicy:
+    """
+    Decides when a cached issue is due for revalidation. Stale entries are still
+    served as they are; staleness only means a background refresh gets queued.
+    """
+
+    def __init__(self, default_ttl, status_ttls):
+        self.default_ttl = default_ttl
+        self.status_ttls = {status.lower(): ttl for status, ttl in status_ttls.items()}
+
+    @classmethod
+    def from_config(cls, config_ref):
+        return cls(config_ref.get("JIRA_CACHE_TTL_SECONDS", DEFAULT_JIRA_CACHE_TTL_SECONDS),
+                   config_ref.get("JIRA_STATUS_TTL_SECONDS", DEFAULT_JIRA_STATUS_TTL_SECONDS))
+
+    def ttl_for(self, entry):
+        status = ((entry.get('data') or {}).get('fields') or {}).get('status') or {}
+        return self.status_ttls.get(str(status.get('name', '')).lower(), self.default_ttl)
+
+    def is_stale(self, issue_id, entry, now=None):
+        """
+        True if entry is missing, or neither fetched nor confirmed unchanged by a sync within its TTL.
+        A key Jira didn't return counts as fresh for the default TTL, so it isn't re-requested every frame.
+        """
+        if not entry:
+            not_found_at = _jira_not_found.get(issue_id)
+            return not_found_at is None or ((now or time.time()) - not_found_at) > self.default_ttl
+        fresh_as_of = entry.get('timestamp', 0)
+        if _last_sync_time is not None and issue_id in _synced_keys:
+            fresh_as_of = max(fresh_as_of, _last_sync_time)
+        return ((now or time.time()) - fresh_as_of) > self.ttl_for(entry)
+
+
+cache_policy = JiraCachePolicy.from_config(config)
+
+
+def _compact_issue(issue_data, fields):
+    """Keeps only the requested fields; object fields are reduced to their name."""
+    compact_fields = {}
+    for field in fields:
+        value = issue_data.get('fields', {}).get(field)
+        if isinstance(value, dict) and 'name' in value:
+            value = {'name': value['name']}
+        compact_fields[field] = value
+    return {'key': issue_data.get('key'), 'fields': compact_fields}
+
+
+def _compact_remotelinks(remotelink_data):
+    return [{'globalId': link.get('globalId'), 'object': {'url': link.get('object', {}).get('url')}}
+            for link in remotelink_data if link.get('globalId') == VF_REMOTE_LINK_ID]
+
+
+def get_cached_issue(issue_id, cache_ref, lock_ref):
+    """Returns the cache entry for issue_id, loading it from disk into cache_ref on first use."""
+    with lock_ref:
+        entry = cache_ref.get(issue_id)
+    if entry is not None or issue_id in _store_misses:
+        return entry
+    entry = load_cached_issue(issue_id)
+    if entry is None:
+        _store_misses.add(issue_id)
+        return None
+    with lock_ref:
+        # A fresh fetch may have landed while we were reading
+        return cache_ref.setdefault(issue_id, entry)
+
+def get_issue_revalidating(issue_id, cache_ref, lock_ref, now=None, priority=PRIORITY_VISIBLE):
+    """
+    Stale-while-revalidate lookup: returns whatever is cached right away (None if
+    nothing is) and queues a background refresh if the cache policy says it is stale.
+    """
+    entry = get_cached_issue(issue_id, cache_ref, lock_ref)
+    if cache_policy.is_stale(issue_id, entry, now):
+        request_jira_issue(issue_id, priority)
+    return entry
+
+
+def warm_jira_cache(issue_ids, cache_ref, lock_ref):
+    """
+    Gets a project's issues ready before its first full redraw: everything on disk is loaded
+    into cache_ref with one query, and the missing or stale issues are queued together so the
+    workers fetch them as one batch.
+    """
+    with lock_ref:
+        missing = [issue_id for issue_id in issue_ids if issue_id not in cache_ref]
+    stored = load_cached_issues(missing)
+    with lock_ref:
+        for issue_id, entry in stored.items():
+            cache_ref.setdefault(issue_id, entry)
+    _store_misses.update(set(missing) - set(stored))
+    now = time.time()
+    queued = 0
+    for issue_id in issue_ids:
+        with lock_ref:
+            entry = cache_ref.get(issue_id)
+        if cache_policy.is_stale(issue_id, entry, now) and request_jira_issue(issue_id, PRIORITY_VISIBLE) is not None:
+            queued += 1
+    return queued
+
+
+def prefetch_jira_issues(issue_ids, cache_ref, lock_ref):
+    """Queues stale issues at PRIORITY_PREFETCH, but only while the fetch queue is idle."""
+    if not jira_request_queue.empty():
+        return
+    now = time.time()
+    for issue_id in issue_ids:
+        if cache_policy.is_stale(issue_id, get_cached_issue(issue_id, cache_ref, lock_ref), now):
+            request_jira_issue(issue_id, PRIORITY_PREFETCH)
+
+
+class TokenBucket:
+    """Allows `rate` requests per second on average, with bursts of up to `capacity`."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Blocks until a token is available and takes it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_seconds = (1 - self.tokens) / self.rate
+            time.sleep(wait_seconds)
+
+
+_rate_limiters = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(url):
+    """The token bucket shared by every request to url's host."""
+    host = urlparse(url).netloc
+    with _rate_limiters_lock:
+        if host not in _rate_limiters:
+            _rate_limiters[host] = TokenBucket(
+                config.get("JIRA_RATE_LIMIT_PER_SECOND", DEFAULT_JIRA_RATE_LIMIT_PER_SECOND),
+                config.get("JIRA_RATE_LIMIT_BURST", DEFAULT_JIRA_RATE_LIMIT_BURST))
+        return _rate_limiters[host]
+
+
+def _jira_get(session, url, **kwargs):
+    get_rate_limiter(url).acquire()
+    return session.get(url, **kwargs)
+
+
+def request_jira_issue(issue_id, priority=PRIORITY_VISIBLE):
+    """
+    Queues issue_id for a refresh and returns the Future of that fetch. A fetch already
+    pending for the issue is reused; if it is still queued at a worse priority it is queued
+    again at this one, and workers skip the outdated entry.
+    Returns None while Jira's circuit breaker is open.
+    """
+    if get_breaker(JIRA_SEARCH_ENDPOINT).is_blocking():
+        return None # Jira is failing; the breaker decides when to try again
+    with jira_in_flight_lock:
+        future = jira_in_flight.get(issue_id)
+        queued_priority = jira_queued_priority.get(issue_id)
+        if future is not None and (queued_priority is None or queued_priority <= priority):
+            return future # Being fetched, or queued at least as urgently
+        if future is None:
+            future = jira_in_flight[issue_id] = Future()
+        jira_queued_priority[issue_id] = priority
+    jira_request_queue.put((priority, next(_request_sequence), issue_id))
+    return future
+
+
+def fetch_jira_issue(issue_id, cache_ref, lock_ref, timeout=None, priority=PRIORITY_SELECTED):
+    """
+    Blocking lookup for callers that need the data now. A fresh cache entry is returned at
+    once; otherwise the issue is requested (sharing any pending fetch) and waited for up to
+    timeout seconds (JIRA_LOOKUP_TIMEOUT_SECONDS by default). On timeout or failure the
+    cached entry, possibly stale, or None is returned.
+    """
+    entry = get_cached_issue(issue_id, cache_ref, lock_ref)
+    if not cache_policy.is_stale(issue_id, entry):
+        return entry
+    future = request_jira_issue(issue_id, priority)
+    if future is None:
+        return entry
+    if timeout is None:
+        timeout = config.get("JIRA_LOOKUP_TIMEOUT_SECONDS", DEFAULT_JIRA_LOOKUP_TIMEOUT_SECONDS)
+    try:
+        return future.result(timeout=timeout) or entry
+    except FutureTimeoutError:
+        return entry
+
+
+def _take_queued_request(item):
+    """Claims a queue item for fetching; False if it was superseded by a better-priority request."""
+    priority, _, issue_id = item
+    with jira_in_flight_lock:
+        if jira_queued_priority.get(issue_id) != priority:
+            return False
+        del jira_queued_priority[issue_id]
+        return True
+
+
+def get_jira_session(permanent_notifications_ref):
+    """
+    Returns the shared, connection-pooled Jira session, or None if there is no usable login.
+    The saved cookies are re-read only when the session file's mtime changes (i.e. after a new login).
+    """
+    global _jira_session, _jira_session_mtime
     session_file = os.path.join(SCRIPT_DIR, config.get("JIRA_SESSION_FILE"))
-    jira_base_url = config.get("JIRA_URL")
 
-    if not os.path.exists(session_file):
+    try:
+        session_mtime = os.path.getmtime(session_file)
+    except OSError:
         if t('jira_login_prompt') not in permanent_notifications_ref: permanent_notifications_ref.append(t('jira_login_prompt'))
-        return None, None
+        return None
+
+    with _jira_session_lock:
+        if _jira_session is None:
+            # One connection per thread sharing the session: the fetch workers, the remote link worker and the sync thread
+            worker_count = max(1, config.get("JIRA_WORKER_COUNT", DEFAULT_JIRA_WORKER_COUNT))
+            pool_size = max(config.get("JIRA_POOL_SIZE", DEFAULT_JIRA_POOL_SIZE), worker_count + 2)
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+            _jira_session = requests.Session()
+            _jira_session.mount("https://", adapter)
+            _jira_session.mount("http://", adapter)
+            _jira_session_mtime = None
+
+        if session_mtime != _jira_session_mtime:
+            try:
+                with open(session_file, 'rb') as f:
+                    cookies = pickle.load(f)
+                _jira_session.cookies.clear()
+                for cookie in cookies:
+                    _jira_session.cookies.set(cookie['name'], cookie['value'], domain=cookie['domain'])
+            except Exception:
+                if t('jira_session_error') not in permanent_notifications_ref: permanent_notifications_ref.append(t('jira_session_error'))
+                logging.info(f"{t('jira_session_error')}")
+                return None
+            _jira_session_mtime = session_mtime
+            logging.info(f"Loaded Jira session cookies from {session_file}")
+            # Failures so far were most likely the expired login
+            get_breaker(JIRA_SEARCH_ENDPOINT).reset()
+            get_breaker(JIRA_REMOTELINK_ENDPOINT).reset()
+        return _jira_session
+
+
+def _report_jira_error(e, url, permanent_notifications_ref):
+    if isinstance(e, requests.exceptions.HTTPError):
+        logging.error(f"Failed to get: {url}")
+        msg = t('jira_auth_error') if e.response.status_code in [401, 403] else t('jira_http_error', status=e.response.status_code)
+    else:
+        msg = t('jira_generic_error', e=str(e))
+    if msg not in permanent_notifications_ref: permanent_notifications_ref.append(msg)
+    if t('jira_login_prompt') not in permanent_notifications_ref: permanent_notifications_ref.append(t('jira_login_prompt'))
+
 
-    session = requests.Session()
+def get_jira_remotelinks(session, issue_id):
+    """The issue's VF remote links, or None if they couldn't be fetched."""
+    breaker = get_breaker(JIRA_REMOTELINK_ENDPOINT)
+    if not breaker.allow_request():
+        return None
+    remotelink_url = f'{config.get("JIRA_URL")}/rest/api/2/issue/{issue_id}/remotelink'
     try:
-        with open(session_file, 'rb') as f:
-            for cookie in pickle.load(f):
-                session.cookies.set(cookie['name'], cookie['value'], domain=cookie['domain'])
-    except Exception:
-        if t('jira_session_error') not in permanent_notifications_ref: permanent_notifications_ref.append(t('jira_session_error'))
-        logging.info(f"{t('jira_session_error')}")
-        return None, None
+        remotelink_response = _jira_get(session, remotelink_url, timeout=15)
+        remotelink_response.raise_for_status()
+        breaker.record_success()
+        return _compact_remotelinks(remotelink_response.json())
+    except requests.exceptions.RequestException as e:
+        breaker.record_error(e)
+    return None
+
 
+def _load_cached_remotelinks(issue_id):
+    try:
+        with _store_lock:
+            row = _get_store().execute("SELECT entry FROM remotelinks WHERE key = ?", (issue_id,)).fetchone()
+    except sqlite3.Error as e:
+        logging.error(f"Jira remote link cache read failed for {issue_id}: {e}")
+        return None
+    return json.loads(row[0]) if row else None
 
-    issue_url = f'{jira_base_url}/rest/api/2/issue/{issue_id}'
-    remotelink_url = f'{jira_base_url}/rest/api/2/issue/{issue_id}/remotelink'
 
+def _save_cached_remotelinks(issue_id, entry):
     try:
-        issue_response = session.get(issue_url, timeout=15)
-        issue_response.raise_for_status()
-        issue_data = issue_response.json()
+        with _store_lock:
+            conn = _get_store()
+            with conn:
+                conn.execute("INSERT INTO remotelinks (key, entry, timestamp) VALUES (?, ?, ?) "
+                             "ON CONFLICT (key) DO UPDATE SET entry = excluded.entry, timestamp = excluded.timestamp",
+                             (issue_id, json.dumps(entry), entry.get('timestamp')))
+        _remotelink_store_misses.discard(issue_id)
+    except (sqlite3.Error, TypeError) as e:
+        logging.info(f"Jira remote link cache save failed for {issue_id}: {e}")
+
+
+def request_remotelinks(issue_id):
+    """Queues a remote link fetch for issue_id unless one is already pending."""
+    if get_breaker(JIRA_REMOTELINK_ENDPOINT).is_blocking():
+        return False
+    with remotelink_cache_lock:
+        if issue_id in remotelink_in_flight:
+            return False
+        remotelink_in_flight.add(issue_id)
+    remotelink_request_queue.put(issue_id)
+    return True
 
-        remotelink_data = []
+
+def get_remotelinks_revalidating(issue_id, now=None):
+    """
+    Returns the cached remote links of issue_id right away (None if never fetched) and
+    queues a fetch if they are missing or older than JIRA_REMOTELINK_TTL_SECONDS.
+    """
+    with remotelink_cache_lock:
+        entry = remotelink_cache.get(issue_id)
+    if entry is None and issue_id not in _remotelink_store_misses:
+        entry = _load_cached_remotelinks(issue_id)
+        if entry is None:
+            _remotelink_store_misses.add(issue_id)
+        else:
+            with remotelink_cache_lock:
+                entry = remotelink_cache.setdefault(issue_id, entry)
+    ttl = config.get("JIRA_REMOTELINK_TTL_SECONDS", DEFAULT_JIRA_REMOTELINK_TTL_SECONDS)
+    if entry is None or ((now or time.time()) - entry.get('timestamp', 0)) > ttl:
+        request_remotelinks(issue_id)
+    return entry['links'] if entry else None
+
+
+def remotelink_worker(stop_event, permanent_notifications_ref):
+    """Fetches the remote links queued by get_remotelinks_revalidating(), one issue at a time."""
+    while not stop_event.is_set():
         try:
-            remotelink_response = session.get(remotelink_url, timeout=15)
-            if remotelink_response.ok: remotelink_data = remotelink_response.json()
-        except requests.exceptions.RequestException: pass
+            issue_id = remotelink_request_queue.get(timeout=1)
+        except queue.Empty:
+            continue
+        try:
+            session = get_jira_session(permanent_notifications_ref)
+            links = get_jira_remotelinks(session, issue_id) if session is not None else None
+            if links is not None:
+                entry = {'links': links, 'timestamp': time.time()}
+                with remotelink_cache_lock:
+                    remotelink_cache[issue_id] = entry
+                _save_cached_remotelinks(issue_id, entry)
+        except Exception as e:
+            logging.error(f"An error occurred in the Jira remote link worker: {e}")
+        finally:
+            with remotelink_cache_lock:
+                remotelink_in_flight.discard(issue_id)
+            remotelink_request_queue.task_done()
 
-        return issue_data, remotelink_data
-    except requests.exceptions.HTTPError as e:
-        logging.error(f"Failed to get: {issue_url}")
-        msg = t('jira_auth_error') if e.response.status_code in [401, 403] else t('jira_http_error', status=e.response.status_code)
-        if msg not in permanent_notifications_ref: permanent_notifications_ref.append(msg)
-        if t('jira_login_prompt') not in permanent_notifications_ref: permanent_notifications_ref.append(t('jira_login_prompt'))
+
+def get_jira_issues_batch(issue_ids, permanent_notifications_ref, updated_within_minutes=None):
+    """
+    Fetches many issues with a single search request (key in (...)), limited to JIRA_FIELDS.
+    With updated_within_minutes only the issues updated in that many minutes are returned.
+    Remote links are not included, see get_remotelinks_revalidating().
+    Returns {issue_id: issue_data} for the issues Jira returned, or None on failure.
+    Ids that aren't valid issue keys are left out of the query and so never returned.
+    """
+    invalid_ids = [issue_id for issue_id in issue_ids if not JIRA_KEY_PATTERN.match(issue_id)]
+    if invalid_ids:
+        logging.info(f"Skipping invalid Jira keys {', '.join(invalid_ids)}")
+        issue_ids = [issue_id for issue_id in issue_ids if JIRA_KEY_PATTERN.match(issue_id)]
+        if not issue_ids:
+            return {}
+    logging.info(f"Get jira issues {', '.join(issue_ids)}")
+    session = get_jira_session(permanent_notifications_ref)
+    if session is None:
+        return None
+    breaker = get_breaker(JIRA_SEARCH_ENDPOINT)
+    if not breaker.allow_request():
+        return None
+
+    search_url = f'{config.get("JIRA_URL")}/rest/api/2/search'
+    fields = config.get("JIRA_FIELDS", DEFAULT_JIRA_FIELDS)
+    jql = f"key in ({','.join(issue_ids)})"
+    if updated_within_minutes is not None:
+        # Relative to the Jira server's clock, so neither side's timezone matters
+        jql += f" AND updated >= -{updated_within_minutes}m"
+    params = {
+        'jql': jql,
+        'fields': ",".join(fields),
+        'maxResults': len(issue_ids),
+        # Unknown or deleted keys are skipped instead of failing the whole query
+        'validateQuery': 'warn',
+    }
+
+    try:
+        search_response = _jira_get(session, search_url, params=params, timeout=15)
+        search_response.raise_for_status()
+        found_issues = search_response.json().get('issues', [])
+        breaker.record_success()
     except requests.exceptions.RequestException as e:
-        msg = t('jira_generic_error', e=str(e))
-        if msg not in permanent_notifications_ref: permanent_notifications_ref.append(msg)
-        if t('jira_login_prompt') not in permanent_notifications_ref: permanent_notifications_ref.append(t('jira_login_prompt'))
-    return None, None
+        breaker.record_error(e)
+        _report_jira_error(e, search_url, permanent_notifications_ref)
+        return None
+
+    return {issue.get('key'): _compact_issue(issue, fields) for issue in found_issues}
+
+
+def _store_fetched_issues(fetched, cache_ref, lock_ref):
+    """Puts fetched issues into the cache and on disk, returning {issue_id: entry}."""
+    now = time.time()
+    entries = {}
+    for issue_id, issue_data in fetched.items():
+        entry = {
+            'data': issue_data,
+            'timestamp': now
+        }
+        with lock_ref: # Use the passed-in lock
+            # Use the passed-in cache reference
+            cache_ref[issue_id] = entry
+        # Only this issue is written, outside the cache lock
+        save_cached_issue(issue_id, entry)
+        entries[issue_id] = entry
+    if _store_writes_since_prune >= max(1, config.get("JIRA_CACHE_MAX_ENTRIES", DEFAULT_JIRA_CACHE_MAX_ENTRIES) // 10):
+        prune_jira_cache(cache_ref, lock_ref)
+    return entries
 
 
 def jira_queue_worker(stop_event, permanent_notifications_ref, cache_ref, lock_ref):
     """
     Worker thread that processes Jira data requests from a queue, acting on a shared cache.
+    Everything waiting in the queue at the best priority is fetched together, up to
+    JIRA_BATCH_SIZE keys per request, so a selected ticket never waits for a large
+    background batch. JIRA_WORKER_COUNT of these share the queue, see start_jira_workers().
     """
+    batch_size = config.get("JIRA_BATCH_SIZE", DEFAULT_JIRA_BATCH_SIZE)
     while not stop_event.is_set():
         try:
-            issue_id = jira_request_queue.get(timeout=1)
-
-            # Fetch new data
-            issue_data, remotelink_data = get_jira_issue_details(issue_id, permanent_notifications_ref)
-
-            # If data was fetched successfully, update the SHARED cache
-            if issue_data:
-                with lock_ref: # Use the passed-in lock
-                    # Use the passed-in cache reference
-                    cache_ref[issue_id] = {
-                        'data': issue_data,
-                        'remotelinks': remotelink_data,
-                        'timestamp': time.time()
-                    }
-                # Save the updated shared cache to the file
-                save_jira_cache(cache_ref, lock_ref)
-
-            # Task is done, remove from the in-flight set so it can be re-queued in the future if needed
-            if issue_id in jira_in_flight:
-                jira_in_flight.remove(issue_id)
-
-            jira_request_queue.task_done()
-
+            item = jira_request_queue.get(timeout=1)
         except queue.Empty:
             # This is expected when the queue is empty, just loop again
             continue
+        if not _take_queued_request(item):
+            jira_request_queue.task_done()
+            continue
+        batch_priority = item[0]
+        issue_ids = [item[2]]
+        while len(issue_ids) < batch_size:
+            try:
+                item = jira_request_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item[0] != batch_priority:
+                # Lower priority work waits for its own batch
+                jira_request_queue.put(item)
+                jira_request_queue.task_done()
+                break
+            if _take_queued_request(item):
+                issue_ids.append(item[2])
+            else:
+                jira_request_queue.task_done()
+
+        entries = {}
+        try:
+            fetched = get_jira_issues_batch(issue_ids, permanent_notifications_ref)
+            entries = _store_fetched_issues(fetched or {}, cache_ref, lock_ref)
+            if fetched is not None:
+                now = time.time()
+                for issue_id in issue_ids:
+                    if issue_id in fetched:
+                        _jira_not_found.pop(issue_id, None)
+                    else:
+                        _jira_not_found[issue_id] = now
         except Exception as e:
             logging.error(f"An error occurred in the Jira queue worker: {e}")
-            # Ensure we remove from in-flight even if there was an error
-            if 'issue_id' in locals() and issue_id in jira_in_flight:
-                jira_in_flight.remove(issue_id)
+        finally:
+            # Done (or failed), so the keys can be re-queued in the future if needed
+            with jira_in_flight_lock:
+                futures = [(issue_id, jira_in_flight.pop(issue_id, None)) for issue_id in issue_ids]
+            for issue_id, future in futures:
+                if future is not None:
+                    future.set_result(entries.get(issue_id))
+                jira_request_queue.task_done()
+
+
+def start_jira_workers(stop_event, permanent_notifications_ref, cache_ref, lock_ref):
+    """Starts the pool of JIRA_WORKER_COUNT fetch workers plus the remote link worker and returns their threads."""
+    worker_count = max(1, config.get("JIRA_WORKER_COUNT", DEFAULT_JIRA_WORKER_COUNT))
+    threads = []
+    for i in range(worker_count):
+        thread = threading.Thread(target=jira_queue_worker, args=(stop_event, permanent_notifications_ref, cache_ref, lock_ref),
+                                  name=f"jira-worker-{i + 1}", daemon=True)
+        thread.start()
+        threads.append(thread)
+    thread = threading.Thread(target=remotelink_worker, args=(stop_event, permanent_notifications_ref),
+                              name="jira-remotelinks", daemon=True)
+    thread.start()
+    threads.append(thread)
+    return threads
+
+
+def _cached_issue_keys():
+    try:
+        with _store_lock:
+            return {key for (key,) in _get_store().execute("SELECT key FROM issues")}
+    except sqlite3.Error as e:
+        logging.error(f"Jira cache read failed: {e}")
+        return set()
+
+
+def sync_jira_issues(permanent_notifications_ref, cache_ref, lock_ref):
+    """
+    One incremental sync pass: asks Jira which tracked, cached issues changed since the
+    last sync and refreshes only those. Keys the last sync didn't cover (new subtasks,
+    resumed projects) are asked about since their own fetch time instead. Returns True
+    if every batch succeeded.
+    """
+    global _last_sync_time, _synced_keys
+    if referenced_jira_keys is None:
+        return False
+    tracked_keys = sorted(referenced_jira_keys & _cached_issue_keys())
+    sync_start = time.time()
+    if _last_sync_time is None:
+        synced_keys, new_keys = [], tracked_keys
+    else:
+        synced_keys = [key for key in tracked_keys if key in _synced_keys]
+        new_keys = [key for key in tracked_keys if key not in _synced_keys]
+    key_groups = [(synced_keys, _last_sync_time)] if synced_keys else []
+    if new_keys:
+        # These may have changed any time since they were fetched
+        timestamps = [entry.get('timestamp', 0) for entry in
+                      (get_cached_issue(key, cache_ref, lock_ref) for key in new_keys) if entry]
+        key_groups.append((new_keys, min(timestamps, default=0)))
+
+    batch_size = config.get("JIRA_BATCH_SIZE", DEFAULT_JIRA_BATCH_SIZE)
+    refreshed = 0
+    for keys, since in key_groups:
+        updated_within_minutes = math.ceil((sync_start - since + JIRA_SYNC_OVERLAP_SECONDS) / 60)
+        for i in range(0, len(keys), batch_size):
+            fetched = get_jira_issues_batch(keys[i:i + batch_size], permanent_notifications_ref, updated_within_minutes)
+            if fetched is None:
+                return False # Try again from the same point next time
+            _store_fetched_issues(fetched, cache_ref, lock_ref)
+            refreshed += len(fetched)
+
+    _synced_keys = set(tracked_keys)
+    _last_sync_time = sync_start
+    _save_sync_state(sync_start, _synced_keys)
+    logging.info(f"Jira sync: {refreshed} of {len(tracked_keys)} tracked issues changed")
+    return True
+
+
+def jira_sync_worker(stop_event, permanent_notifications_ref, cache_ref, lock_ref):
+    """Runs sync_jira_issues() every JIRA_SYNC_INTERVAL_SECONDS (0 disables it)."""
+    global _last_sync_time, _synced_keys
+    interval = config.get("JIRA_SYNC_INTERVAL_SECONDS", DEFAULT_JIRA_SYNC_INTERVAL_SECONDS)
+    if not interval or interval <= 0:
+        return
+    _last_sync_time, _synced_keys = _load_sync_state()
+    while not stop_event.is_set():
+        try:
+            sync_jira_issues(permanent_notifications_ref, cache_ref, lock_ref)
+        except Exception as e:
+            logging.error(f"An error occurred in the Jira sync worker: {e}")
+        stop_event.wait(interval)
@@ -0,0 +1,77 @@
+import logging
+
+SUBTASK_STATUSES = ["todo", "in_progress", "done", "hidden", "focused"]
+
+
+def _migrate_sub_tasks(sub_tasks_for_ticket):
+    """Converts one project's subtasks from the old field layout to the 'status' layout."""
+    for sub_task_name, sub_task_details in list(sub_tasks_for_ticket.items()):
+        if not isinstance(sub_task_details, dict):
+            current_status = "done" if sub_task_details else "todo"
+            sub_tasks_for_ticket[sub_task_name] = {"status": current_status, "notes": [], "pr_url": None, "pr_status": None, "jira_refreshed": None}
+            continue
+
+        # Migrate old status fields to new 'status' field
+        current_status = sub_task_details.get("status")
+        if not current_status or current_status not in SUBTASK_STATUSES:
+            if sub_task_details.get("hidden", False):
+                current_status = "hidden"
+            elif sub_task_details.get("done", False):
+                current_status = "done"
+            elif sub_task_details.get("focused", False):
+                current_status = "focused"
+            else:
+                current_status = "todo"
+
+        sub_task_details["status"] = current_status
+        sub_task_details.setdefault("notes", [])
+        sub_task_details.setdefault("pr_url", None)
+        sub_task_details.setdefault("pr_status", None)
+        sub_task_details.setdefault("jira_refreshed", None)
+
+        # Clean up old fields
+        sub_task_details.pop("done", None)
+        sub_task_details.pop("hidden", None)
+        sub_task_details.pop("focused", None)
+        if "pr_unhandled_comments" in sub_task_details:
+            if sub_task_details["pr_unhandled_comments"] and sub_task_details.get("pr_status") is None:
+                sub_task_details["pr_status"] = "attention_needed"
+            del sub_task_details["pr_unhandled_comments"]
+
+        if sub_task_details.get("pr_url") and "notes" in sub_task_details:
+            sub_task_details["notes"] = [note for note in sub_task_details["notes"] if not note.strip().startswith("PR:")]
+
+
+def _migrate_v1_subtask_status(data):
+    """Old boolean done/hidden/focused fields -> 'status', PR: notes -> pr_url only."""
+    for ticket_name, sub_tasks_for_ticket in data.get("sub_tasks", {}).items():
+        if isinstance(sub_tasks_for_ticket, dict):
+            _migrate_sub_tasks(sub_tasks_for_ticket)
+        elif sub_tasks_for_ticket is not None:
+            data["sub_tasks"][ticket_name] = {}
+    # Paused projects carry their own copy of the subtasks
+    for paused_item in data.get("paused_tasks", []):
+        if isinstance(paused_item.get("sub_tasks"), dict):
+            _migrate_sub_tasks(paused_item["sub_tasks"])
+        else:
+            paused_item["sub_tasks"] = {}
+
+
+# (version, step) in ascending order; a data file at version N runs every step above N once
+MIGRATIONS = [
+    (1, _migrate_v1_subtask_status),
+]
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def migrate_data(data):
+    """Brings data up to SCHEMA_VERSION. Returns True if any step ran and data needs saving."""
+    version = data.get("schema_version", 0)
+    if version >= SCHEMA_VERSION:
+        return False
+    for step_version, step in MIGRATIONS:
+        if step_version > version:
+            logging.info(f"Migrating data to schema version {step_version}")
+            step(data)
+    data["schema_version"] = SCHEMA_VERSION
+    return True
@@ -0,0 +1,64 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+
+SCRIPT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+DB_FILE = os.path.join(SCRIPT_DIR, "pr_sync.db")
+
+# One row per tracked PR: its poll schedule and the state derived from its activities
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pr_sync (pr_url TEXT PRIMARY KEY, schedule TEXT, state TEXT);
+"""
+
+_connection = None
+_db_lock = threading.Lock()
+
+
+def _get_connection():
+    global _connection
+    if _connection is None:
+        _connection = sqlite3.connect(DB_FILE, check_same_thread=False)
+        _connection.execute("PRAGMA journal_mode=WAL")
+        _connection.executescript(SCHEMA)
+    return _connection
+
+
+def load_all():
+    """Returns ({pr_url: schedule}, {pr_url: state}) as saved by the last run."""
+    schedules, states = {}, {}
+    try:
+        with _db_lock:
+            rows = _get_connection().execute("SELECT pr_url, schedule, state FROM pr_sync").fetchall()
+    except sqlite3.Error as e:
+        logging.error(f"PR sync state unavailable: {e}")
+        return schedules, states
+    for pr_url, schedule, state in rows:
+        if schedule: schedules[pr_url] = json.loads(schedule)
+        if state: states[pr_url] = json.loads(state)
+    return schedules, states
+
+
+def save(pr_url, schedule, state):
+    try:
+        with _db_lock:
+            conn = _get_connection()
+            with conn:
+                conn.execute("INSERT INTO pr_sync (pr_url, schedule, state) VALUES (?, ?, ?) "
+                             "ON CONFLICT (pr_url) DO UPDATE SET schedule = excluded.schedule, state = excluded.state",
+                             (pr_url, json.dumps(schedule), json.dumps(state) if state is not None else None))
+    except (sqlite3.Error, TypeError) as e:
+        logging.error(f"PR sync state save failed for {pr_url}: {e}")
+
+
+def delete(pr_urls):
+    if not pr_urls:
+        return
+    try:
+        with _db_lock:
+            conn = _get_connection()
+            with conn:
+                conn.executemany("DELETE FROM pr_sync WHERE pr_url = ?", [(pr_url,) for pr_url in pr_urls])
+    except sqlite3.Error as e:
+        logging.error(f"PR sync state delete failed: {e}")
@@ -0,0 +1,186 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+
+SCRIPT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+DB_FILE = os.path.join(SCRIPT_DIR, "jira_data.db")
+
+EVENT_KINDS = ("meetings", "interruptions", "recurring_events")
+# How deep a changed path is resolved for each section, e.g. a change inside
+# ("sub_tasks", project, ticket, "notes") is written as the whole ticket row.
+SECTION_DEPTH = {"sub_tasks": 3, "notes": 2, "daily_notes": 2}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS projects (name TEXT PRIMARY KEY, has_tickets INTEGER NOT NULL DEFAULT 0, notes TEXT);
+CREATE TABLE IF NOT EXISTS tickets (project TEXT NOT NULL, name TEXT NOT NULL, details TEXT NOT NULL, PRIMARY KEY (project, name));
+CREATE TABLE IF NOT EXISTS daily_notes (date TEXT PRIMARY KEY, notes TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS events (id INTEGER PRIMARY KEY AUTOINCREMENT, kind TEXT NOT NULL, payload TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS idx_events_kind ON events (kind);
+CREATE TABLE IF NOT EXISTS paused_tasks (position INTEGER PRIMARY KEY, ticket TEXT, payload TEXT NOT NULL);
+"""
+
+_connection = None
+_db_lock = threading.Lock()
+
+
+def _dumps(value):
+    return json.dumps(value, default=str, ensure_ascii=False)
+
+
+def _get_connection():
+    global _connection
+    if _connection is None:
+        _connection = sqlite3.connect(DB_FILE, check_same_thread=False)
+        _connection.execute("PRAGMA journal_mode=WAL")
+        _connection.execute("PRAGMA synchronous=NORMAL")
+        _connection.executescript(SCHEMA)
+    return _connection
+
+
+def is_empty():
+    with _db_lock:
+        conn = _get_connection()
+        return conn.execute("SELECT 1 FROM settings LIMIT 1").fetchone() is None
+
+
+def load_data():
+    """Builds the app_data dict from the tables. Daily notes are left out and loaded per date."""
+    data = {"sub_tasks": {}, "notes": {}, "daily_notes": {}, "paused_tasks": []}
+    with _db_lock:
+        conn = _get_connection()
+        for key, value in conn.execute("SELECT key, value FROM settings"):
+            data[key] = json.loads(value)
+        for name, has_tickets, notes in conn.execute("SELECT name, has_tickets, notes FROM projects"):
+            if has_tickets:
+                data["sub_tasks"][name] = {}
+            if notes is not None:
+                data["notes"][name] = json.loads(notes)
+        for project, name, details in conn.execute("SELECT project, name, details FROM tickets ORDER BY rowid"):
+            data["sub_tasks"].setdefault(project, {})[name] = json.loads(details)
+        for kind in EVENT_KINDS:
+            data[kind] = [json.loads(payload) for (payload,) in
+                          conn.execute("SELECT payload FROM events WHERE kind = ? ORDER BY id", (kind,))]
+        data["paused_tasks"] = [json.loads(payload) for (payload,) in
+                                conn.execute("SELECT payload FROM paused_tasks ORDER BY position")]
+    return data
+
+
+def load_daily_notes(date_iso):
+    with _db_lock:
+        row = _get_connection().execute("SELECT notes FROM daily_notes WHERE date = ?", (date_iso,)).fetchone()
+    return json.loads(row[0]) if row else []
+
+
+def _write_ticket(conn, project, name, details):
+    if details is None:
+        conn.execute("DELETE FROM tickets WHERE project = ? AND name = ?", (project, name))
+        return
+    conn.execute("INSERT INTO projects (name, has_tickets) VALUES (?, 1) "
+                 "ON CONFLICT (name) DO UPDATE SET has_tickets = 1", (project,))
+    conn.execute("INSERT INTO tickets (project, name, details) VALUES (?, ?, ?) "
+                 "ON CONFLICT (project, name) DO UPDATE SET details = excluded.details",
+                 (project, name, _dumps(details)))
+
+
+def _write_project_tickets(conn, project, sub_tasks):
+    if not isinstance(sub_tasks, dict):
+        conn.execute("DELETE FROM tickets WHERE project = ?", (project,))
+        conn.execute("UPDATE projects SET has_tickets = 0 WHERE name = ?", (project,))
+        return
+    existing = {name for (name,) in conn.execute("SELECT name FROM tickets WHERE project = ?", (project,))}
+    for name in existing - set(sub_tasks):
+        conn.execute("DELETE FROM tickets WHERE project = ? AND name = ?", (project, name))
+    conn.execute("INSERT INTO projects (name, has_tickets) VALUES (?, 1) "
+                 "ON CONFLICT (name) DO UPDATE SET has_tickets = 1", (project,))
+    for name, details in sub_tasks.items():
+        _write_ticket(conn, project, name, details)
+
+
+def _write_project_notes(conn, project, notes):
+    value = _dumps(notes) if notes is not None else None
+    conn.execute("INSERT INTO projects (name, notes) VALUES (?, ?) "
+                 "ON CONFLICT (name) DO UPDATE SET notes = excluded.notes", (project, value))
+
+
+def _write_daily_notes(conn, date_iso, notes):
+    conn.execute("INSERT INTO daily_notes (date, notes) VALUES (?, ?) "
+                 "ON CONFLICT (date) DO UPDATE SET notes = excluded.notes", (date_iso, _dumps(notes)))
+
+
+def _write_section(conn, data, section):
+    value = data.get(section)
+    if section == "sub_tasks":
+        value = value or {}
+        stored = {name for (name,) in conn.execute("SELECT name FROM projects WHERE has_tickets = 1")}
+        for project in stored - set(value):
+            _write_project_tickets(conn, project, None)
+        for project, sub_tasks in value.items():
+            _write_project_tickets(conn, project, sub_tasks)
+    elif section == "notes":
+        value = value or {}
+        stored = {name for (name,) in conn.execute("SELECT name FROM projects WHERE notes IS NOT NULL")}
+        for project in stored - set(value):
+            _write_project_notes(conn, project, None)
+        for project, notes in value.items():
+            _write_project_notes(conn, project, notes)
+    elif section == "daily_notes":
+        # Only the dates currently held in memory; other dates stay as stored
+        for date_iso, notes in (value or {}).items():
+            _write_daily_notes(conn, date_iso, notes)
+    elif section in EVENT_KINDS:
+        conn.execute("DELETE FROM events WHERE kind = ?", (section,))
+        conn.executemany("INSERT INTO events (kind, payload) VALUES (?, ?)",
+                         [(section, _dumps(event)) for event in value or []])
+    elif section == "paused_tasks":
+        conn.execute("DELETE FROM paused_tasks")
+        conn.executemany("INSERT INTO paused_tasks (position, ticket, payload) VALUES (?, ?, ?)",
+                         [(i, item.get("ticket"), _dumps(item)) for i, item in enumerate(value or [])])
+    elif section in data:
+        conn.execute("INSERT INTO settings (key, value) VALUES (?, ?) "
+                     "ON CONFLICT (key) DO UPDATE SET value = excluded.value", (section, _dumps(value)))
+    else:
+        conn.execute("DELETE FROM settings WHERE key = ?", (section,))
+
+
+def _write_path(conn, data, path):
+    section = path[0]
+    path = path[:SECTION_DEPTH.get(section, 1)]
+    if len(path) == 1:
+        _write_section(conn, data, section)
+        return
+    section_value = data.get(section) or {}
+    if section == "sub_tasks" and len(path) == 3:
+        _write_ticket(conn, path[1], path[2], (section_value.get(path[1]) or {}).get(path[2]))
+    elif section == "sub_tasks":
+        _write_project_tickets(conn, path[1], section_value.get(path[1]))
+    elif section == "notes":
+        _write_project_notes(conn, path[1], section_value.get(path[1]))
+    elif section == "daily_notes" and path[1] in section_value:
+        _write_daily_notes(conn, path[1], section_value[path[1]])
+
+
+def write_paths(data, paths):
+    """Writes only the rows behind the given changed paths, in one transaction."""
+    with _db_lock:
+        conn = _get_connection()
+        with conn:
+            for path in paths:
+                _write_path(conn, data, path)
+
+
+def write_all(data):
+    with _db_lock:
+        conn = _get_connection()
+        with conn:
+            for section in set(data) | set(EVENT_KINDS) | {"sub_tasks", "notes", "paused_tasks"}:
+                _write_section(conn, data, section)
+
+
+def import_json_data(data):
+    """One-shot import of a fully loaded jira_data.json into an empty database."""
+    write_all(data)
+    logging.info(f"Imported {len(data.get('sub_tasks', {}))} projects and "
+                 f"{len(data.get('daily_notes', {}))} days of notes into {DB_FILE}")
@@ -0,0 +1,407 @@
+import copy
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import sys
+import threading
+
+from . import config_manager
+from . import sqlite_store
+from inc.helpers import t
+
+SCRIPT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+DATA_FILE = os.path.join(SCRIPT_DIR, "jira_data.json")
+JOURNAL_FILE = DATA_FILE + ".journal"
+# Journal that is being folded into the snapshot by the compaction thread
+COMPACTING_JOURNAL_FILE = JOURNAL_FILE + ".1"
+
+DEFAULT_JOURNAL_MAX_BYTES = 1024 * 1024
+DEFAULT_SAVE_DEBOUNCE_SECONDS = 1.0
+DEFAULT_BACKUP_COUNT = 3
+
+_journal_lock = threading.Lock()
+_changed_paths = []
+_changed_paths_lock = threading.Lock()
+# Bumped on every mark_changed(), per top-level section, so the UI can tell whether anything changed
+_section_versions = {}
+# Bumped by every full snapshot and stored in it; each journal starts with the generation it builds on
+_snapshot_generation = 0
+SNAPSHOT_GENERATION_KEY = "_snapshot_generation"
+_compaction_running = False
+
+# Write-behind saver state, see start_data_saver()
+_save_requested = threading.Event()
+_pending_data = None
+_pending_full_save = False
+_saver_thread = None
+_saver_stop_event = None
+
+
+def sqlite_enabled():
+    return config_manager.config.get("STORAGE_BACKEND", "json") == "sqlite"
+
+
+def journal_enabled():
+    return bool(config_manager.config.get("DATA_JOURNAL", True))
+
+
+def mark_changed(*path):
+    """Records that the value at path (e.g. "sub_tasks", ticket, subtask) changed.
+
+    The next save_data() writes only the marked paths to the journal instead
+    of re-serializing the whole data file.
+    """
+    with _changed_paths_lock:
+        _changed_paths.append(list(path))
+        section = path[0] if path else None
+        _section_versions[section] = _section_versions.get(section, 0) + 1
+
+
+def data_version(*sections):
+    """Change counter for the given top-level sections (all sections if none given)."""
+    with _changed_paths_lock:
+        if not sections:
+            return sum(_section_versions.values())
+        # A whole-data change (mark_changed() without a path) counts for every section
+        return sum(_section_versions.get(section, 0) for section in sections + (None,))
+
+
+def _take_changed_paths():
+    with _changed_paths_lock:
+        paths = _changed_paths[:]
+        _changed_paths.clear()
+    # A marked parent already covers its children
+    paths.sort(key=len)
+    unique_paths = []
+    for path in paths:
+        if not any(path[:len(p)] == p for p in unique_paths):
+            unique_paths.append(path)
+    return unique_paths
+
+
+def _get_path(data, path):
+    value = data
+    for key in path:
+        if not isinstance(value, dict) or key not in value:
+            raise KeyError(key)
+        value = value[key]
+    return value
+
+
+def _apply_journal_entry(data, entry):
+    path = entry.get("path")
+    if not path:
+        return
+    parent = data
+    for key in path[:-1]:
+        if not isinstance(parent.get(key), dict):
+            parent[key] = {}
+        parent = parent[key]
+    if entry.get("delete"):
+        parent.pop(path[-1], None)
+    else:
+        parent[path[-1]] = entry.get("value")
+
+
+def replay_journal(data, journal_file, snapshot_generation=0):
+    """
+    Applies every complete entry of journal_file to data, in order. A journal written
+    against an older snapshot than snapshot_generation is skipped: a crash after a full
+    save replaced the snapshot but before it removed the journals left it behind.
+    """
+    try:
+        with open(journal_file, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f):
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn last line from a crash mid-append; everything before it is valid
+                    logging.info(f"Skipping broken journal line in {journal_file}")
+                    continue
+                if line_number == 0 and "generation" in entry:
+                    if entry["generation"] < snapshot_generation:
+                        logging.info(f"Skipping {journal_file}, it predates the snapshot")
+                        return data
+                    continue
+                _apply_journal_entry(data, entry)
+    except FileNotFoundError:
+        pass
+    return data
+
+
+def load_snapshot():
+    global _snapshot_generation
+    data = {}
+    try:
+        with open(DATA_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        pass
+    except json.JSONDecodeError:
+        print(t('error_json_read', file=DATA_FILE), file=sys.stderr)
+    generation = data.pop(SNAPSHOT_GENERATION_KEY, 0)
+    with _journal_lock:
+        _snapshot_generation = max(_snapshot_generation, generation)
+    replay_journal(data, COMPACTING_JOURNAL_FILE, generation)
+    replay_journal(data, JOURNAL_FILE, generation)
+    return data
+
+
+def load_stored_data():
+    """Loads app data from the configured backend.
+
+    With the SQLite backend the existing jira_data.json (plus journal) is
+    imported once into an empty database, and daily notes are not loaded up
+    front; see load_daily_notes().
+    """
+    if not sqlite_enabled():
+        return load_snapshot()
+    if sqlite_store.is_empty() and (os.path.exists(DATA_FILE) or os.path.exists(JOURNAL_FILE)):
+        sqlite_store.import_json_data(load_snapshot())
+    return sqlite_store.load_data()
+
+
+def load_daily_notes(data, date_iso):
+    """Returns the notes list for one date, fetching just that date from SQLite when needed.
+
+    Call with data_lock held: other dates are evicted from data, and the saver
+    copies pending changes out of data under that lock.
+    """
+    daily_notes = data.setdefault("daily_notes", {})
+    if sqlite_enabled() and date_iso not in daily_notes:
+        # Keep only the viewed date in memory, plus any date whose change the saver hasn't written yet
+        with _changed_paths_lock:
+            keep_all = _pending_full_save or any(path in ([], ["daily_notes"]) for path in _changed_paths)
+            unsaved_dates = set(daily_notes) if keep_all else {
+                path[1] for path in _changed_paths if len(path) > 1 and path[0] == "daily_notes"}
+        for stored_date in list(daily_notes):
+            if stored_date not in unsaved_dates:
+                del daily_notes[stored_date]
+        daily_notes[date_iso] = sqlite_store.load_daily_notes(date_iso)
+    return daily_notes.get(date_iso, [])
+
+
+def _write_json(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=4, default=str, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _rotate_backups():
+    """Keeps the previous snapshots as jira_data.json.bak1 (newest) .. bakN."""
+    backup_count = config_manager.config.get("DATA_BACKUP_COUNT", DEFAULT_BACKUP_COUNT)
+    if backup_count <= 0 or not os.path.exists(DATA_FILE):
+        return
+    for i in range(backup_count - 1, 0, -1):
+        older = f"{DATA_FILE}.bak{i}"
+        if os.path.exists(older):
+            os.replace(older, f"{DATA_FILE}.bak{i + 1}")
+    newest = f"{DATA_FILE}.bak1"
+    try:
+        # A hard link keeps the old snapshot without copying it; DATA_FILE never disappears
+        if os.path.exists(newest): os.remove(newest)
+        os.link(DATA_FILE, newest)
+    except OSError:
+        shutil.copy2(DATA_FILE, newest)
+
+
+def _replace_snapshot(tmp_file):
+    _rotate_backups()
+    os.replace(tmp_file, DATA_FILE)
+
+
+def write_snapshot(data):
+    """Atomically replaces the full data file and drops the journal it supersedes."""
+    global _snapshot_generation
+    tmp_file = DATA_FILE + ".tmp"
+    with _journal_lock:
+        generation = _snapshot_generation + 1
+        _write_json(tmp_file, dict(data, **{SNAPSHOT_GENERATION_KEY: generation}))
+        _replace_snapshot(tmp_file)
+        # From here the journals are outdated even if removing them fails, see replay_journal()
+        _snapshot_generation = generation
+        for journal_file in (JOURNAL_FILE, COMPACTING_JOURNAL_FILE):
+            try:
+                os.remove(journal_file)
+            except FileNotFoundError:
+                pass
+
+
+def append_journal(data, paths):
+    lines = []
+    for path in paths:
+        try:
+            entry = {"path": path, "value": _get_path(data, path)}
+        except KeyError:
+            entry = {"path": path, "delete": True}
+        lines.append(json.dumps(entry, default=str, ensure_ascii=False) + "\n")
+
+    with _journal_lock:
+        with open(JOURNAL_FILE, 'a', encoding='utf-8') as f:
+            if f.tell() == 0:
+                f.write(json.dumps({"generation": _snapshot_generation}) + "\n")
+            f.writelines(lines)
+            journal_size = f.tell()
+
+    max_bytes = config_manager.config.get("DATA_JOURNAL_MAX_BYTES", DEFAULT_JOURNAL_MAX_BYTES)
+    if journal_size >= max_bytes:
+        start_compaction()
+
+
+def start_compaction():
+    """Rotates the journal aside and folds it into the snapshot in the background."""
+    global _compaction_running
+    with _journal_lock:
+        if _compaction_running:
+            return
+        # A leftover rotated journal (failed or interrupted compaction) is folded first
+        if not os.path.exists(COMPACTING_JOURNAL_FILE):
+            if not os.path.exists(JOURNAL_FILE):
+                return
+            os.replace(JOURNAL_FILE, COMPACTING_JOURNAL_FILE)
+        _compaction_running = True
+        generation = _snapshot_generation
+    threading.Thread(target=_compact_journal, args=(generation,), daemon=True).start()
+
+
+def _compact_journal(generation):
+    global _compaction_running
+    try:
+        _fold_compacting_journal(generation)
+    finally:
+        with _journal_lock:
+            _compaction_running = False
+
+
+def _fold_compacting_journal(generation):
+    data = {}
+    try:
+        with open(DATA_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        pass
+    except json.JSONDecodeError:
+        logging.error(f"Compaction skipped, {DATA_FILE} is not readable")
+        return
+    # The folded snapshot keeps its generation: the journal started after the rotation builds on it too
+    replay_journal(data, COMPACTING_JOURNAL_FILE, data.get(SNAPSHOT_GENERATION_KEY, 0))
+
+    tmp_file = DATA_FILE + ".compact.tmp"
+    try:
+        _write_json(tmp_file, data)
+        with _journal_lock:
+            if generation != _snapshot_generation:
+                # A full save replaced the snapshot meanwhile; our result is older than it
+                os.remove(tmp_file)
+                return
+            _replace_snapshot(tmp_file)
+            os.remove(COMPACTING_JOURNAL_FILE)
+        logging.info(f"Compacted journal into {DATA_FILE}")
+    except (IOError, OSError, TypeError) as e:
+        logging.error(f"Journal compaction failed: {e}")
+
+
+def _write_data(data, paths, full_save):
+    try:
+        if sqlite_enabled():
+            if full_save:
+                sqlite_store.write_all(data)
+            else:
+                sqlite_store.write_paths(data, paths)
+        elif journal_enabled() and not full_save:
+            append_journal(data, paths)
+        else:
+            write_snapshot(data)
+    except (IOError, OSError, sqlite3.Error) as e:
+        print(t('error_json_save', file=DATA_FILE, e=e), file=sys.stderr)
+    except TypeError as e:
+        print(t('error_json_convert', e=e), file=sys.stderr)
+
+
+def _freeze_paths(data, paths):
+    """Deep-copies just the marked paths into a sparse dict with the same layout."""
+    frozen = {}
+    for path in paths:
+        try:
+            value = _get_path(data, path)
+        except KeyError:
+            continue # Stays missing, written as a delete
+        parent = frozen
+        for key in path[:-1]:
+            parent = parent.setdefault(key, {})
+        parent[path[-1]] = copy.deepcopy(value)
+    return frozen
+
+
+def save_data(data):
+    """Persists data, writing only the paths marked with mark_changed() where the backend allows.
+
+    While the saver thread runs this only queues the save and returns at once.
+    """
+    global _pending_data, _pending_full_save
+    with _changed_paths_lock:
+        if not _changed_paths:
+            _pending_full_save = True
+        _pending_data = data
+    if _saver_thread is not None and _saver_thread.is_alive():
+        _save_requested.set()
+        return
+    _flush_pending_save(None)
+
+
+def _flush_pending_save(data_lock):
+    """Writes everything requested since the last flush as one write.
+
+    With a data_lock the changed values are copied under it and written after
+    it is released, so other threads never wait on disk I/O.
+    """
+    global _pending_data, _pending_full_save
+    if data_lock is not None: data_lock.acquire()
+    try:
+        _save_requested.clear()
+        with _changed_paths_lock:
+            data = _pending_data
+            full_save = _pending_full_save
+            _pending_data = None
+            _pending_full_save = False
+        if data is None:
+            return
+        paths = _take_changed_paths()
+        full_save = full_save or not paths or [] in paths
+        if data_lock is not None:
+            data = copy.deepcopy(data) if full_save else _freeze_paths(data, paths)
+    finally:
+        if data_lock is not None: data_lock.release()
+    _write_data(data, paths, full_save)
+
+
+def data_saver_worker(stop_event, data_lock):
+    """Persistence thread: folds bursts of save_data() calls into one write per debounce window."""
+    debounce_seconds = config_manager.config.get("SAVE_DEBOUNCE_SECONDS", DEFAULT_SAVE_DEBOUNCE_SECONDS)
+    while not stop_event.is_set():
+        if not _save_requested.wait(timeout=1):
+            continue
+        stop_event.wait(debounce_seconds)
+        _flush_pending_save(data_lock)
+    # Final flush so nothing queued is lost on exit
+    _flush_pending_save(data_lock)
+
+
+def start_data_saver(data_lock):
+    global _saver_thread, _saver_stop_event
+    _saver_stop_event = threading.Event()
+    _saver_thread = threading.Thread(target=data_saver_worker, args=(_saver_stop_event, data_lock), daemon=True)
+    _saver_thread.start()
+
+
+def stop_data_saver():
+    """Stops the saver thread after it has written any pending save."""
+    global _saver_thread
+    if _saver_thread is None:
+        return
+    _saver_stop_event.set()
+    _saver_thread.join()
+    _saver_thread = None
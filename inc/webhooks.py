@@ -0,0 +1,67 @@
+import hashlib
+import hmac
+import json
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _WebhookHandler(BaseHTTPRequestHandler):
+    """Accepts Bitbucket Server webhook POSTs and hands pull request events to server.on_pr_event."""
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        secret = self.server.secret
+        if secret:
+            expected = "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+            # As bytes: compare_digest() raises on str with non-ASCII characters
+            signature = self.headers.get('X-Hub-Signature', '').encode('utf-8', 'replace')
+            if not hmac.compare_digest(expected.encode(), signature):
+                self.send_response(401)
+                self.end_headers()
+                return
+        try:
+            payload = json.loads(body or b"{}")
+        except ValueError:
+            self.send_response(400)
+            self.end_headers()
+            return
+        event_key = self.headers.get('X-Event-Key') or payload.get('eventKey', '')
+        if event_key.startswith("pr:") and isinstance(payload.get('pullRequest'), dict):
+            try:
+                self.server.on_pr_event(event_key, payload['pullRequest'])
+            except Exception as e:
+                logging.error(f"Webhook handler failed for {event_key}: {e}")
+        else:
+            logging.info(f"Ignored webhook event '{event_key}'")
+        self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        # The default writes to stderr, which would garble the curses screen
+        logging.debug("Webhook: " + format % args)
+
+
+class _WebhookServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # The default prints the traceback to stderr, over the curses screen
+        logging.exception(f"Webhook request from {client_address[0]} failed")
+
+
+def start_webhook_server(host, port, secret, on_pr_event):
+    """
+    Starts the webhook listener on a daemon thread. on_pr_event(event_key, pull_request)
+    is called for every pr:* event. Returns the server, or None if it couldn't bind.
+    """
+    try:
+        server = _WebhookServer((host, port), _WebhookHandler)
+    except OSError as e:
+        logging.error(f"Webhook listener could not start on {host}:{port}: {e}")
+        return None
+    server.secret = secret
+    server.on_pr_event = on_pr_event
+    threading.Thread(target=server.serve_forever, name="webhooks", daemon=True).start()
+    logging.info(f"Webhook listener on {host}:{server.server_address[1]}")
+    return server
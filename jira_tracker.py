@@ -9,6 +9,7 @@ import locale
 from urllib.parse import urlparse, urlunparse
 import re
 import threading
+from concurrent.futures import ThreadPoolExecutor, Future
 import requests
 import subprocess
 import webbrowser
@@ -22,15 +23,33 @@ import inc.config_manager
 
 from inc.jira import (
     load_jira_cache,
-    jira_queue_worker,  # Import the new worker
-    jira_request_queue, # Import the queue
-    jira_in_flight,     # Import the in-flight tracker
+    get_cached_issue,
+    set_referenced_jira_keys,
+    prune_jira_cache,
+    VF_REMOTE_LINK_ID,
+    start_jira_workers,
+    jira_sync_worker,
+    get_issue_revalidating,
+    prefetch_jira_issues,
+    warm_jira_cache,
+    get_remotelinks_revalidating,
+    fetch_jira_issue,
+    PRIORITY_SELECTED,
+    PRIORITY_VISIBLE,
     get_and_save_jira_session,  # old
     # jira_data_poller, # old
     config as jira_config
 )
 import inc.helpers
+import inc.pr_sync_store
+from inc.circuit_breaker import get_breaker, breaker_status_lines
 from inc.helpers import t
+from inc.storage import (
+    load_stored_data, load_daily_notes, save_data, mark_changed, data_version,
+    start_data_saver, stop_data_saver
+)
+from inc.migrations import migrate_data
+from inc.webhooks import start_webhook_server
 
 # Attempt to import Selenium, but allow the app to run without it.
 try:
@@ -61,6 +80,7 @@ reviews_lock = threading.Lock()
 sent_review_notifications = set()
 permanent_notifications = []
 app_data = {}
+jira_warmed_ticket = None # Project whose Jira issues were last loaded up front, see display_ui()
 
 
 # -- Setup Locale --
@@ -71,7 +91,6 @@ except locale.Error as e:
 
 # -- Constants and Globals --
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-DATA_FILE = os.path.join(SCRIPT_DIR, "jira_data.json")
 JIRA_BOX_FILE = os.path.join(SCRIPT_DIR, "jira_box2.txt")
 
 # -- Color Pairs --
@@ -81,6 +100,33 @@ JIRA_BOX_FILE = os.path.join(SCRIPT_DIR, "jira_box2.txt")
  COLOR_PAIR_PERMANENT_NOTIFICATION, COLOR_PAIR_STANDOUT) = range(1, 14)
 
 # -- Views --
+# Circuit breaker names, also shown in the notification line while open
+STASH_PR_ENDPOINT = "Stash"
+STASH_REVIEWS_ENDPOINT = "Stash reviews"
+# When each PR is polled next, see next_pr_poll_interval(): pr_url -> {'next_poll': ts or None, 'interval': s, 'last_poll': ts}
+# Both are saved in pr_sync.db, so a restart carries on from where the last run stopped
+pr_poll_schedule = {}
+# What the PR activities so far add up to, see merge_pr_activities(): pr_url -> state dict
+pr_activity_state = {}
+# PRs a webhook reported since the last poll: api_url -> pull request JSON from the payload
+pr_webhook_events = {}
+pr_poll_lock = threading.Lock() # Guards pr_poll_schedule, pr_activity_state and pr_webhook_events
+PR_POLL_TICK_SECONDS = 30 # How often the poller checks which PRs are due
+pr_next_dashboard_check = None # When PR_DASHBOARD_CHANGE_DETECTION next looks for changed PRs, None if it is off
+pr_poll_wakeup = threading.Event() # Set by the webhook listener to poll at once
+review_poll_wakeup = threading.Event()
+webhook_active = False # While the listener runs, polling is only a slow reconciliation
+# Webhook events that can change which PRs wait for my review
+REVIEW_LIST_EVENTS = ("pr:opened", "pr:reviewer:", "pr:modified", "pr:merged", "pr:declined", "pr:deleted")
+# Caps simultaneous requests to Stash across the PR and review pollers
+stash_connection_limit = threading.BoundedSemaphore(max(1, inc.config_manager.config.get("STASH_MAX_CONNECTIONS", 4)))
+# The running PR poller, stopped by stop_pr_poller() when main() returns
+pr_polling_thread = None
+pr_poll_stop_event = None
+# This run's Jira fetch, remote link and sync threads, stopped by stop_jira_threads() when main() returns
+jira_stop_event = None
+jira_threads = []
+
 VIEW_MAIN = "main"
 VIEW_DEDICATED_NOTES = "dedicated_notes"
 VIEW_DAILY_NOTES = "daily_notes"
@@ -94,15 +140,7 @@ WEEKDAY_MAP = {
 
 
 def load_data():
-    data = {}
-    try:
-        with open(DATA_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    except FileNotFoundError:
-        pass
-    except json.JSONDecodeError:
-        print(t('error_json_read', file=DATA_FILE), file=sys.stderr)
-        pass
+    data = load_stored_data()
 
     data.setdefault("current_ticket", None)
     data.setdefault("focused_ticket", None)
@@ -119,59 +157,30 @@ def load_data():
     data.setdefault("daily_notes", {})
     data.setdefault("show_hidden_tasks", False)
 
-    # Data migration and cleanup logic
-    for ticket_name, sub_tasks_for_ticket in data.get("sub_tasks", {}).items():
-        if isinstance(sub_tasks_for_ticket, dict):
-            for sub_task_name, sub_task_details in list(sub_tasks_for_ticket.items()):
-                if not isinstance(sub_task_details, dict):
-                    current_status = "done" if sub_task_details else "todo"
-                    sub_tasks_for_ticket[sub_task_name] = {"status": current_status, "notes": [], "pr_url": None, "pr_status": None, "jira_refreshed": None}
-                else:
-                    # Migrate old status fields to new 'status' field
-                    current_status = sub_task_details.get("status")
-                    if not current_status or current_status not in ["todo", "in_progress", "done", "hidden", "focused"]:
-                        if sub_task_details.get("hidden", False):
-                            current_status = "hidden"
-                        elif sub_task_details.get("done", False):
-                            current_status = "done"
-                        elif sub_task_details.get("focused", False):
-                            current_status = "focused"
-                        else:
-                            current_status = "todo"
-
-                    sub_task_details["status"] = current_status
-                    sub_task_details.setdefault("notes", [])
-                    sub_task_details.setdefault("pr_url", None)
-                    sub_task_details.setdefault("pr_status", None)
-                    sub_task_details.setdefault("jira_refreshed", None)
-
-                    # Clean up old fields
-                    sub_task_details.pop("done", None)
-                    sub_task_details.pop("hidden", None)
-                    sub_task_details.pop("focused", None)
-                    # Old field cleanup for migration
-                    if "pr_unhandled_comments" in sub_task_details:
-                        if sub_task_details["pr_unhandled_comments"] and sub_task_details.get("pr_status") is None:
-                             sub_task_details["pr_status"] = "attention_needed"
-                        del sub_task_details["pr_unhandled_comments"]
-
-
-                    if sub_task_details.get("pr_url") and "notes" in sub_task_details:
-                        cleaned_notes = [note for note in sub_task_details["notes"] if not note.strip().startswith("PR:")]
-                        sub_task_details["notes"] = cleaned_notes
-
-        elif sub_tasks_for_ticket is not None :
-             data["sub_tasks"][ticket_name] = {}
+    # Old data layouts are upgraded once, then the version is saved with the data
+    if migrate_data(data):
+        save_data(data)
     return data
 
-def save_data(data):
-    try:
-        with open(DATA_FILE, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4, default=str, ensure_ascii=False)
-    except IOError as e:
-        print(t('error_json_save', file=DATA_FILE, e=e), file=sys.stderr)
-    except TypeError as e:
-         print(t('error_json_convert', e=e), file=sys.stderr)
+def collect_referenced_jira_keys(data):
+    """Jira keys of every subtask in any project, paused project or completed project."""
+    sub_task_dicts = list(data.get("sub_tasks", {}).values())
+    sub_task_dicts += [paused_item.get("sub_tasks") for paused_item in data.get("paused_tasks", [])]
+    return jira_keys_in(sub_task_dicts)
+
+def collect_paused_jira_keys(data):
+    """Jira keys of the subtasks in paused projects, for idle-time prefetch."""
+    return jira_keys_in([paused_item.get("sub_tasks") for paused_item in data.get("paused_tasks", [])])
+
+def jira_keys_in(sub_task_dicts):
+    keys = set()
+    for sub_tasks in sub_task_dicts:
+        if not isinstance(sub_tasks, dict): continue
+        for sub_task_name in sub_tasks:
+            jira_ticket_id = inc.helpers.get_jira_ticket_from_url(sub_task_name)
+            if jira_ticket_id != sub_task_name:
+                keys.add(jira_ticket_id)
+    return keys
 
 def format_timedelta_minutes(delta):
     if not isinstance(delta, timedelta):
@@ -256,7 +265,8 @@ def read_jira_box_content(max_lines=10):
         return []
 
 
-def display_dedicated_notes_view(stdscr, data, command_buffer, entity_for_notes, show_help_footer, selected_note_idx):
+def display_dedicated_notes_view(stdscr, data, command_buffer, entity_for_notes, show_help_footer, selected_note_idx,
+                                 jira_cache=None, jira_cache_lock=None):
     height, width = stdscr.getmaxyx()
     now_time_str = datetime.now().strftime("%H:%M:%S")
     stdscr.clear()
@@ -280,6 +290,13 @@ def display_dedicated_notes_view(stdscr, data, command_buffer, entity_for_notes,
             notes_list_to_display = data.get("notes", {}).get(entity_name, [])
         elif entity_type == "subtask" and main_task_name_context and entity_name:
             title = t('dedicated_notes_header_subtask', main_task=main_task_name_context, name=entity_name)
+            jira_ticket_id = inc.helpers.get_jira_ticket_from_url(entity_name)
+            if jira_ticket_id != entity_name and jira_cache is not None:
+                # Never blocks on redraw; entering the view already waited once for the summary
+                issue = get_issue_revalidating(jira_ticket_id, jira_cache, jira_cache_lock, priority=PRIORITY_SELECTED)
+                summary = ((issue or {}).get('data', {}).get('fields') or {}).get('summary')
+                if summary:
+                    title = t('dedicated_notes_header_subtask', main_task=main_task_name_context, name=f"{jira_ticket_id} {summary}")
             subtask_details = data.get("sub_tasks",{}).get(main_task_name_context,{}).get(entity_name)
             if subtask_details and isinstance(subtask_details, dict):
                 notes_list_to_display = subtask_details.get("notes", [])
@@ -374,6 +391,7 @@ def display_daily_notes_view(stdscr, data, command_buffer, current_date_for_note
     weekday_str = t('weekdays')[current_date_for_notes.weekday()]
     title = t('daily_notes_header', date=date_str_iso, weekday=weekday_str)
 
+    # Loaded by the main loop under data_lock, see load_daily_notes()
     notes_list_to_display = data.get("daily_notes", {}).get(date_str_iso, [])
 
     stdscr.addstr(row, 0, title[:width])
@@ -457,10 +475,11 @@ def display_ui(stdscr, data, command_buffer="", full_redraw=False, selected_subt
                current_date_for_daily_notes_arg=None, selected_note_idx=-1,
                jira_cache=None, jira_cache_lock=None):
 
-    global pull_requests_for_review, permanent_notifications
+    global pull_requests_for_review, permanent_notifications, jira_warmed_ticket
 
     if current_view_mode == VIEW_DEDICATED_NOTES:
-        return display_dedicated_notes_view(stdscr, data, command_buffer, entity_for_dedicated_notes, show_help_footer, selected_note_idx)
+        return display_dedicated_notes_view(stdscr, data, command_buffer, entity_for_dedicated_notes, show_help_footer, selected_note_idx,
+                                            jira_cache, jira_cache_lock)
     if current_view_mode == VIEW_DAILY_NOTES:
         return display_daily_notes_view(stdscr, data, command_buffer, current_date_for_daily_notes_arg, show_help_footer, selected_note_idx)
 
@@ -483,12 +502,15 @@ def display_ui(stdscr, data, command_buffer="", full_redraw=False, selected_subt
 
     all_displayable_tickets = sorted([t for t in list(filter(None, all_tickets_set)) if t not in completed_tickets])
 
+    # A project was just switched to or resumed: load its issues in one go before drawing it
+    if data.get("current_ticket") != jira_warmed_ticket:
+        jira_warmed_ticket = data.get("current_ticket")
+        warm_jira_cache(jira_keys_in([data.get("sub_tasks", {}).get(jira_warmed_ticket)]), jira_cache, jira_cache_lock)
+
     # To avoid locking frequently, we make a quick copy of the cache for this render pass.
     with jira_cache_lock:
         cache_copy = jira_cache.copy()
 
-    # Define the cache timeout (10 minutes = 600 seconds) as you suggested
-    JIRA_CACHE_TIMEOUT = 600
     now = time.time()
 
     display_right_panel = bool(all_displayable_tickets)
@@ -774,12 +796,9 @@ def display_ui(stdscr, data, command_buffer="", full_redraw=False, selected_subt
                 item_attr = curses.color_pair(COLOR_PAIR_DEFAULT)
 
                 if jira_ticket_id != sub_task_name:
-                    cached_item = cache_copy.get(jira_ticket_id)
-                    should_fetch = not cached_item or (now - cached_item.get('timestamp', 0)) > JIRA_CACHE_TIMEOUT
-
-                    if should_fetch and jira_ticket_id not in jira_in_flight:
-                        jira_in_flight.add(jira_ticket_id)
-                        jira_request_queue.put(jira_ticket_id)
+                    # Shows the cached status at once; a stale entry is refreshed in the background
+                    fetch_priority = PRIORITY_SELECTED if i == selected_subtask_idx else PRIORITY_VISIBLE
+                    cached_item = get_issue_revalidating(jira_ticket_id, jira_cache, jira_cache_lock, now, fetch_priority)
 
                     if cached_item:
                         status = cached_item.get('data', {}).get('fields', {}).get('status', {}).get('name', 'N/A')
@@ -836,8 +855,21 @@ def display_ui(stdscr, data, command_buffer="", full_redraw=False, selected_subt
                 approvers_str = "PR " + status_text + ": " + ", ".join(pr_details.get('approvers_formatted', []))
                 task_info_to_show.insert(1, approvers_str)
 
+            if sel_sub_details.get("pr_url"):
+                with pr_poll_lock:
+                    pr_schedule = pr_poll_schedule.get(sel_sub_details.get("pr_url"))
+                    next_dashboard_check = pr_next_dashboard_check
+                if pr_schedule and pr_schedule.get('next_poll') is None:
+                    task_info_to_show.append(t('ui_pr_polling_stopped'))
+                elif pr_schedule:
+                    next_check = pr_schedule['next_poll']
+                    if pr_schedule.get('on_dashboard') and next_dashboard_check is not None:
+                        # Changes show up at the next dashboard query, the direct poll is only the fallback
+                        next_check = min(next_check, next_dashboard_check)
+                    task_info_to_show.append(t('ui_pr_next_poll', time=datetime.fromtimestamp(next_check).strftime("%H:%M:%S")))
+
 
-            cached_item = cache_copy.get(sel_sub_name, {})
+            cached_item = cache_copy.get(sel_sub_name) or get_cached_issue(sel_sub_name, jira_cache, jira_cache_lock) or {}
 
             if cached_item:
                 status = cached_item.get('data', {}).get('fields', {}).get('status', {}).get('name', 'N/A')
@@ -854,7 +886,15 @@ def display_ui(stdscr, data, command_buffer="", full_redraw=False, selected_subt
                     status_icon = "🗂️"
 
 
-                vf_link = next((l.get("object",{}).get("url") for l in cached_item.get('remotelinks',[]) if l.get("globalId") == "VF - Log Hours"), "N/A")
+                remotelinks = get_remotelinks_revalidating(sel_sub_name, now) or []
+                vf_link = next((l.get("object",{}).get("url") for l in remotelinks if l.get("globalId") == VF_REMOTE_LINK_ID), "N/A")
+                if jira_config.get("JIRA_REMOTELINK_PREFETCH_NEIGHBOURS", True):
+                    # Arrowing up or down usually lands on one of these next
+                    for neighbour_idx in (selected_subtask_idx - 1, selected_subtask_idx + 1):
+                        if 0 <= neighbour_idx < len(subtask_list_to_use):
+                            neighbour_id = inc.helpers.get_jira_ticket_from_url(subtask_list_to_use[neighbour_idx][0])
+                            if neighbour_id != subtask_list_to_use[neighbour_idx][0]:
+                                get_remotelinks_revalidating(neighbour_id, now)
                 task_info_to_show.insert(0, f"{vf_link}")
 
                 jira_link = f"{inc.config_manager.config.get('JIRA_URL')}/browse/{sel_sub_name}"
@@ -1115,8 +1155,10 @@ def show_permanent_notification(stdscr):
         notification_line = height - 2
 
         row = 1
-        if permanent_notifications:
-            for msg in permanent_notifications:
+        # Failing endpoints report their backoff state here too
+        notification_lines = permanent_notifications + breaker_status_lines()
+        if notification_lines:
+            for msg in notification_lines:
 
                 stdscr.addstr(notification_line, 0, " " * (width-1 if width > 0 else 0))
                 stdscr.addstr(notification_line, 0, f"{row}. {msg[:width-3]}", curses.color_pair(COLOR_PAIR_PERMANENT_NOTIFICATION) | curses.A_BOLD)
@@ -1169,6 +1211,7 @@ def handle_input(data, command_parts, stdscr, current_view_mode, selected_subtas
             data_dict["current_ticket"] = None
             if "task_start_time" in data_dict:
                 del data_dict["task_start_time"]
+            mark_changed("paused_tasks"); mark_changed("current_ticket"); mark_changed("task_start_time")
             paused_modified = True
         return paused_modified
 
@@ -1190,6 +1233,7 @@ def handle_input(data, command_parts, stdscr, current_view_mode, selected_subtas
                 pause_current_task(data)
                 data["current_ticket"] = new_task_name_cmd
                 data["task_start_time"] = time.time()
+                mark_changed("completed_tickets"); mark_changed("current_ticket"); mark_changed("task_start_time")
                 data_was_modified = True
                 show_notification(stdscr, t('cmd_info_task_restored', name=new_task_name_cmd))
                 return data
@@ -1209,6 +1253,8 @@ def handle_input(data, command_parts, stdscr, current_view_mode, selected_subtas
             data["task_start_time"] = time.time()
             data.setdefault("sub_tasks", {}).setdefault(new_task_name_cmd, {})
             data.setdefault("notes", {}).setdefault(new_task_name_cmd, [])
+            mark_changed("current_ticket"); mark_changed("task_start_time")
+            mark_changed("sub_tasks", new_task_name_cmd); mark_changed("notes", new_task_name_cmd)
             data_was_modified = True
             if pause_modified_by_n: show_notification(stdscr, t('cmd_info_task_resumed', name=new_task_name_cmd))
             else: show_notification(stdscr, t('cmd_info_task_started', name=new_task_name_cmd))
@@ -1219,6 +1265,7 @@ def handle_input(data, command_parts, stdscr, current_view_mode, selected_subtas
 
     elif command == 't':
         data["show_hidden_tasks"] = not data.get("show_hidden_tasks", False)
+        mark_changed("show_hidden_tasks")
         return data
 
     elif command == 'd':
@@ -1229,6 +1276,7 @@ def handle_input(data, command_parts, stdscr, current_view_mode, selected_subtas
                 data["sub_tasks"][current_ticket_name_val][sub_task_to_hide_name]["status"] = "hidden"
                 if data["focused_subtask"] == sub_task_to_hide_name:
                     data["focused_subtask"] = None # Clear global focus if this was the one
+                mark_changed("sub_tasks", current_ticket_name_val, sub_task_to_hide_name); mark_changed("focused_subtask")
                 data_was_modified = True
                 show_notification(stdscr, t('cmd_info_subtask_hidden', name=sub_task_to_hide_name))
             else:
@@ -1244,6 +1292,7 @@ def handle_input(data, command_parts, stdscr, current_view_mode, selected_subtas
             current_ticket_subtasks = data.setdefault("sub_tasks", {}).setdefault(current_ticket_name_val, {})
             if sub_task_name_cmd not in current_ticket_subtasks:
                 current_ticket_subtasks[sub_task_name_cmd] = {"status": "todo", "notes": [], "pr_url": None, "pr_status": None, "jira_refreshed": None}
+                mark_changed("sub_tasks", current_ticket_name_val, sub_task_name_cmd)
                 data_was_modified = True
             else:
                 show_notification(stdscr, t('cmd_err_subtask_exists', name=sub_task_name_cmd))
@@ -1260,6 +1309,7 @@ def handle_input(data, command_parts, stdscr, current_view_mode, selected_subtas
                    sub_task_to_modify_name in data["sub_tasks"][current_ticket_name_val]:
                     data["sub_tasks"][current_ticket_name_val][sub_task_to_modify_name]["pr_url"] = pr_url
                     data["sub_tasks"][current_ticket_name_val][sub_task_to_modify_name]["pr_status"] = None # Reset status
+                    mark_changed("sub_tasks", current_ticket_name_val, sub_task_to_modify_name)
                     data_was_modified = True
                     show_notification(stdscr, t('cmd_info_pr_added', name=sub_task_to_modify_name))
                 else:
@@ -1280,6 +1330,8 @@ def handle_input(data, command_parts, stdscr, current_view_mode, selected_subtas
             data["current_ticket"] = None
             if "task_start_time" in data:
                 del data["task_start_time"]
+            mark_changed("completed_tickets"); mark_changed("current_ticket"); mark_changed("task_start_time")
+            mark_changed("focused_ticket"); mark_changed("focused_subtask")
             data_was_modified = True
             show_notification(stdscr, t('cmd_info_task_completed_and_hidden', name=current_ticket_name_val))
         else:
@@ -1307,6 +1359,7 @@ def handle_input(data, command_parts, stdscr, current_view_mode, selected_subtas
                 data["focused_subtask"] = sub_task_name
                 show_notification(stdscr, t('cmd_info_subtask_focus_set', name=sub_task_name))
 
+            mark_changed("sub_tasks", current_ticket_name_val); mark_changed("focused_ticket"); mark_changed("focused_subtask")
             data_was_modified = True
         else:
             show_notification(stdscr, t('cmd_prompt_select_subtask_for_focus'))
@@ -1360,6 +1413,7 @@ def handle_input(data, command_parts, stdscr, current_view_mode, selected_subtas
                     data["sub_tasks"][target_ticket][target_subtask]["status"] = "focused"
                     data["focused_subtask"] = target_subtask
 
+                mark_changed("sub_tasks"); mark_changed("focused_ticket"); mark_changed("focused_subtask")
                 data_was_modified = True
                 show_notification(stdscr, t('cmd_info_focus_set', name=target_ticket))
             else:
@@ -1371,6 +1425,7 @@ def handle_input(data, command_parts, stdscr, current_view_mode, selected_subtas
             for ticket_subtasks in data["sub_tasks"].values():
                 for st in ticket_subtasks.values():
                     st["focused"] = False
+            mark_changed("sub_tasks"); mark_changed("focused_ticket"); mark_changed("focused_subtask")
             data_was_modified = True
             show_notification(stdscr, t('cmd_info_focus_cleared'))
 
@@ -1387,12 +1442,14 @@ def handle_input(data, command_parts, stdscr, current_view_mode, selected_subtas
                     sub_task_details_cmd = data["sub_tasks"][current_ticket_name_val].get(selected_sub_task_name_cmd)
                     if sub_task_details_cmd and isinstance(sub_task_details_cmd, dict):
                         sub_task_details_cmd.setdefault("notes", []).append(note_text_cmd)
+                        mark_changed("sub_tasks", current_ticket_name_val, selected_sub_task_name_cmd)
                         data_was_modified = True
                         show_notification(stdscr, t('cmd_info_note_added_to_subtask', name=selected_sub_task_name_cmd))
                     else: show_notification(stdscr, t('cmd_err_subtask_details_not_found', name=selected_sub_task_name_cmd))
                 else: show_notification(stdscr, t('cmd_err_main_task_details_not_found', name=current_ticket_name_val))
             else:
                 data.setdefault("notes", {}).setdefault(current_ticket_name_val, []).append(note_text_cmd)
+                mark_changed("notes", current_ticket_name_val)
                 data_was_modified = True
                 show_notification(stdscr, t('cmd_info_note_added_to_task', name=current_ticket_name_val))
         else: show_notification(stdscr, t('cmd_usage_add_note'))
@@ -1413,6 +1470,7 @@ def handle_input(data, command_parts, stdscr, current_view_mode, selected_subtas
             try:
                 datetime.strptime(time_str, "%H:%M"); weekday_int = WEEKDAY_MAP[weekday_str]
                 data.setdefault("recurring_events", []).append({'type': event_type, 'weekday': weekday_int,'time': time_str, 'details': details})
+                mark_changed("recurring_events")
                 data_was_modified = True
                 show_notification(stdscr, t('cmd_info_recurring_event_added', type=event_type, day=weekday_str.upper(), time=time_str))
             except ValueError: show_notification(stdscr, t('cmd_err_invalid_time', time=time_str))
@@ -1425,6 +1483,7 @@ def handle_input(data, command_parts, stdscr, current_view_mode, selected_subtas
                 if event_datetime < datetime.now() - timedelta(minutes=5): event_datetime += timedelta(days=1)
                 details_key = 'link' if event_type == 'meeting' else 'message'
                 data.setdefault(target_list_key, []).append({"datetime": event_datetime.isoformat(), details_key: details})
+                mark_changed(target_list_key)
                 data_was_modified = True
                 show_notification(stdscr, t('cmd_info_event_added', type=event_type, datetime=event_datetime.strftime('%Y-%m-%d %H:%M')))
             except ValueError: show_notification(stdscr, t('cmd_err_invalid_time', time=time_str))
@@ -1470,44 +1529,18 @@ def handle_input(data, command_parts, stdscr, current_view_mode, selected_subtas
                     resumed_item_details = data["paused_tasks"].pop(i)
                     data['current_ticket'] = target_ticket_name_to_activate
                     data['task_start_time'] = resumed_item_details.get('task_start_time', time.time())
-                    resumed_sub_tasks_raw = resumed_item_details.get('sub_tasks', {})
-                    migrated_resumed_sub_tasks = {}
-                    if isinstance(resumed_sub_tasks_raw, dict):
-                        for sub_name, sub_details in resumed_sub_tasks_raw.items():
-                            if not isinstance(sub_details, dict):
-                                migrated_resumed_sub_tasks[sub_name] = {"status": "done" if bool(sub_details) else "todo", "notes": [], "pr_url": None, "pr_status": None, "jira_refreshed": None}
-                            else:
-                                current_status = sub_details.get("status", "todo")
-                                if sub_details.get("hidden", False):
-                                    current_status = "hidden"
-                                elif sub_details.get("done", False):
-                                    current_status = "done"
-                                elif sub_details.get("focused", False):
-                                    current_status = "focused"
-
-                                sub_details["status"] = current_status
-                                sub_details.setdefault("notes", [])
-                                sub_details.setdefault("pr_url", None)
-                                sub_details.setdefault("pr_status", None)
-                                sub_details.setdefault("jira_refreshed", None)
-
-                                sub_details.pop("done", None)
-                                sub_details.pop("hidden", None)
-                                sub_details.pop("focused", None)
-                                migrated_resumed_sub_tasks[sub_name] = sub_details
-                    data.setdefault("sub_tasks", {})[target_ticket_name_to_activate] = migrated_resumed_sub_tasks
+                    # Paused subtasks are already in the current layout (see inc.migrations)
+                    data.setdefault("sub_tasks", {})[target_ticket_name_to_activate] = resumed_item_details.get('sub_tasks', {})
                     data.setdefault("notes", {})[target_ticket_name_to_activate] = resumed_item_details.get('notes', [])
                     found_in_paused_and_removed = True; break
 
             if not found_in_paused_and_removed:
                 data['current_ticket'] = target_ticket_name_to_activate
                 data['task_start_time'] = time.time()
-                current_subs = data.setdefault("sub_tasks", {}).setdefault(target_ticket_name_to_activate, {})
-                for sub_name, sub_details in list(current_subs.items()):
-                    if not isinstance(sub_details, dict):
-                        sub_details.setdefault("status", "todo"); sub_details.setdefault("notes", []); sub_details.setdefault("pr_url", None); sub_details.setdefault("pr_status", None); sub_details.setdefault("jira_refreshed", False)
-
+                data.setdefault("sub_tasks", {}).setdefault(target_ticket_name_to_activate, {})
                 data.setdefault("notes", {}).setdefault(target_ticket_name_to_activate, [])
+            mark_changed("paused_tasks"); mark_changed("current_ticket"); mark_changed("task_start_time")
+            mark_changed("sub_tasks", target_ticket_name_to_activate); mark_changed("notes", target_ticket_name_to_activate)
             data_was_modified = True
             show_notification(stdscr, t('cmd_info_switched_to_task', name=target_ticket_name_to_activate))
     else:
@@ -1545,12 +1578,16 @@ def poll_reviews_needed():
         return # Missing essential config or using placeholder
 
     headers = {"Authorization": f"Bearer {api_token}", "Accept": "application/json;charset=UTF-8"}
+    breaker = get_breaker(STASH_REVIEWS_ENDPOINT)
 
     while True:
+        if not breaker.allow_request():
+            review_poll_wakeup.wait(60)
+            review_poll_wakeup.clear()
+            continue
         try:
-            response = requests.get(review_url, headers=headers, timeout=20)
-            response.raise_for_status()
-            prs_data = response.json()
+            prs_data = stash_get_json(review_url, headers, timeout=20)
+            breaker.record_success()
 
             pending_reviews = []
             for pr in prs_data.get('values', []):
@@ -1571,6 +1608,7 @@ def poll_reviews_needed():
                 pull_requests_for_review.extend(pending_reviews)
 
         except requests.exceptions.RequestException as e:
+            breaker.record_error(e)
             print(t('polling_err', url=review_url, e=e), file=sys.stderr)
             pass # Silently continue on network errors
 
@@ -1579,147 +1617,415 @@ def poll_reviews_needed():
              current_review_ids = {pr['id'] for pr in pull_requests_for_review}
              sent_review_notifications.intersection_update(current_review_ids)
 
-        time.sleep(300) # Poll every 5 minutes
-
-def poll_pull_requests(data_lock, data_ref):
+        # Poll every 5 minutes, or at the reconciliation interval while webhooks push changes
+        review_poll_wakeup.wait(inc.config_manager.config.get("WEBHOOK_RECONCILE_SECONDS", 1800) if webhook_active else 300)
+        review_poll_wakeup.clear()
+
+def stash_get_json(url, headers, timeout=10, params=None):
+    """GET a Stash API url within the shared connection cap and return the decoded JSON."""
+    with stash_connection_limit:
+        response = requests.get(url, headers=headers, params=params, timeout=timeout)
+    response.raise_for_status()
+    return response.json()
+
+def stash_get_json_revalidating(url, headers, etag, cached_json, timeout=10):
+    """
+    Like stash_get_json(), but sends the ETag of cached_json so an unchanged resource
+    costs only a 304. Returns (json, etag).
+    """
+    if etag and cached_json is not None:
+        headers = dict(headers, **{"If-None-Match": etag})
+    with stash_connection_limit:
+        response = requests.get(url, headers=headers, timeout=timeout)
+    if response.status_code == 304:
+        return cached_json, etag
+    response.raise_for_status()
+    return response.json(), response.headers.get("ETag")
+
+def fetch_new_pr_activities(api_url, headers, cursor):
+    """
+    Pages through the PR's activities, newest first, until the activity with id cursor.
+    With no cursor every page is fetched. Returns the new activities, newest first.
+    """
+    page_size = inc.config_manager.config.get("PR_ACTIVITY_PAGE_SIZE", 25)
+    new_activities = []
+    start = 0
+    while True:
+        page = stash_get_json(f"{api_url}/activities", headers, params={'start': start, 'limit': page_size})
+        for activity in page.get("values", []):
+            if cursor is not None and activity.get("id", 0) <= cursor:
+                return new_activities
+            new_activities.append(activity)
+        if page.get("isLastPage", True) or page.get("nextPageStart") is None:
+            return new_activities
+        start = page["nextPageStart"]
+
+def fetch_pr_state(pr_url, headers, executor, pr_state, pr_json=None):
+    """
+    Fetches a PR and its activities newer than pr_state's cursor, both at once on executor.
+    The PR itself is revalidated with the ETag from pr_state; with pr_json (the PR as the
+    dashboard returned it) only the activities are fetched. The reviewers future yields
+    (pr_json, etag). Makes network calls, so never call it while holding data_lock.
+    """
+    api_url = convert_to_api_url(pr_url)
+    if pr_json is not None:
+        reviewers_future = Future()
+        reviewers_future.set_result((pr_json, pr_state.get('etag')))
+    else:
+        reviewers_future = executor.submit(stash_get_json_revalidating, api_url, headers, pr_state.get('etag'), pr_state.get('pr_json'))
+    activities_future = executor.submit(fetch_new_pr_activities, api_url, headers, pr_state.get('cursor'))
+    return reviewers_future, activities_future
+
+def dashboard_pr_api_url(pr_json):
+    repository = pr_json.get("toRef", {}).get("repository", {})
+    project_key = repository.get("project", {}).get("key")
+    if project_key and repository.get("slug") and pr_json.get("id") is not None:
+        return f"{inc.config_manager.config.get('STASH_URL')}/rest/api/1.0/projects/{project_key}/repos/{repository['slug']}/pull-requests/{pr_json['id']}"
+    self_links = pr_json.get("links", {}).get("self", [])
+    return convert_to_api_url(self_links[0].get("href", "")) if self_links else None
+
+def fetch_authored_prs(headers):
+    """
+    All my open PRs from the dashboard in one paged query, with state, reviewers and
+    updatedDate. Returns {api_url: pr_json}.
+    """
+    dashboard_url = f"{inc.config_manager.config.get('STASH_URL')}/rest/api/latest/dashboard/pull-requests"
+    authored_prs = {}
+    start = 0
+    while True:
+        page = stash_get_json(dashboard_url, headers, timeout=20, params={'role': 'AUTHOR', 'state': 'OPEN', 'start': start, 'limit': 100})
+        for pr_json in page.get("values", []):
+            api_url = dashboard_pr_api_url(pr_json)
+            if api_url: authored_prs[api_url] = pr_json
+        if page.get("isLastPage", True) or page.get("nextPageStart") is None:
+            return authored_prs
+        start = page["nextPageStart"]
+
+def new_pr_activity_state():
+    # comments: comment id (as str) -> {'version', 'replied'}, for every comment examined so far
+    # unhandled: comment id -> {'version', 'author', 'text'} for comments by others I haven't replied to
+    # updated_date: the PR's dashboard updatedDate when last fetched, None if it isn't on the dashboard
+    # etag, pr_json: the PR as last fetched directly, revalidated with If-None-Match
+    return {'cursor': None, 'state': None, 'merged': False, 'approver_ids': [], 'comments': {}, 'unhandled': {},
+            'newest_activity': 0, 'updated_date': None, 'etag': None, 'pr_json': None}
+
+def merge_pr_activities(pr_state, new_activities, my_user_id):
+    """
+    Folds activities newer than pr_state['cursor'] into pr_state. Only comments that are
+    new or whose version changed are examined. Returns True if the history has to be read
+    again from the start: a new reply of mine to a thread seen in an earlier poll, whose
+    parent the activity doesn't name. Within one read the thread's own activity already
+    lists its replies, so a first poll never needs a rescan.
+    """
+    had_cursor = pr_state['cursor'] is not None
+    needs_rescan = False
+    for activity in reversed(new_activities): # Oldest first
+        action = activity.get("action")
+        pr_state['cursor'] = max(pr_state['cursor'] or 0, activity.get("id", 0))
+        pr_state['newest_activity'] = max(pr_state['newest_activity'], activity.get("createdDate") or 0)
+        if action == "MERGED":
+            pr_state['merged'] = True
+        elif action == "APPROVED":
+            approver_id = activity.get("user", {}).get("id")
+            if approver_id and approver_id not in pr_state['approver_ids']:
+                pr_state['approver_ids'].append(approver_id)
+        elif action == "COMMENTED":
+            comment = activity.get("comment") or {}
+            comment_key = str(comment.get("id"))
+            indexed = pr_state['comments'].get(comment_key)
+            if activity.get("commentAction") == "DELETED":
+                pr_state['comments'].pop(comment_key, None)
+                pr_state['unhandled'].pop(comment_key, None)
+                continue
+            is_mine = comment.get("author", {}).get("id") == my_user_id
+            is_reply = activity.get("commentAction") == "REPLIED" or comment.get("parent") is not None
+            if indexed is None and is_mine and is_reply and had_cursor:
+                parent_key = str((comment.get("parent") or {}).get("id"))
+                if parent_key in pr_state['comments']:
+                    pr_state['comments'][parent_key]['replied'] = True
+                    pr_state['unhandled'].pop(parent_key, None)
+                else:
+                    needs_rescan = True
+            if indexed is None and activity.get("commentAction", "ADDED") != "ADDED":
+                continue
+            if indexed is not None and indexed['version'] == comment.get("version"):
+                continue # Already examined at this version
+            replied = has_my_reply(comment, my_user_id)
+            pr_state['comments'][comment_key] = {'version': comment.get("version"), 'replied': replied}
+            if is_mine or replied:
+                pr_state['unhandled'].pop(comment_key, None)
+            else:
+                pr_state['unhandled'][comment_key] = {'version': comment.get("version"),
+                                                      'author': comment.get("author", {}).get("displayName"),
+                                                      'text': comment.get("text")}
+    return needs_rescan
+
+def apply_pr_state(subtask, ticket, subtask_name, reviewers, pr_state, my_user_id, desktop_notifications):
+    """
+    Updates one subtask from its fetched PR state. Runs under data_lock; desktop
+    notifications are collected into desktop_notifications and sent after it is released.
+    Returns True if the subtask changed.
+    """
+    data_changed = False
+    pr_url = subtask.get("pr_url")
+    pr_status = subtask.get("pr_status")
+
+    is_merged = pr_state['merged'] or pr_state['state'] == 'MERGED'
+    unique_approvers = pr_state['approver_ids']
+
+    # Format approvers
+    approvers_formatted = []
+    approver_count = 0
+    total_reviewers = len(reviewers.get('reviewers', []))
+    for r in reviewers.get('reviewers', []):
+        status_emoji = "❓" # Not responded
+        if r['status'] == 'APPROVED':
+            status_emoji = "✅"
+            approver_count += 1
+        elif r['status'] == 'NEEDS_WORK':
+            status_emoji = "❌"
+        approvers_formatted.append(f"{status_emoji} {r['user']['displayName']}")
+
+    # Determine overall status text
+    status_text = "waiting"
+    if pr_state['state'] == 'MERGED':
+        status_text = "merged"
+    elif pr_state['state'] == 'DECLINED':
+        status_text = "declined"
+    elif approver_count > 0:
+        status_text = f"approved ({approver_count}/{total_reviewers})"
+
+    # Store in the main data object
+    pr_details = {
+        'status_text': status_text,
+        'approvers_formatted': approvers_formatted
+    }
+    if subtask.get('pr_details') != pr_details:
+        subtask['pr_details'] = pr_details
+        data_changed = True
+
+    if is_merged:
+        if pr_status != 'merged':
+            subtask['pr_status'] = 'merged'
+            sync_pr_comment_notes(subtask, {})
+            notes = subtask.get('notes', [])
+            subtask['notes'] = [n for n in notes if not n.startswith("UNHANDLED") and not n.startswith(t('polling_note_approved'))]
+            data_changed = True
+            desktop_notifications.append((t('notification_pr_merged_title', main_task=ticket, sub_task=format_subtask_for_title(subtask_name)), t('notification_pr_merged_body', pr_url=pr_url)))
+    elif len(unique_approvers) >= 2:
+        if pr_status != 'approved':
+            subtask['pr_status'] = 'approved'
+            sync_pr_comment_notes(subtask, {})
+            notes = subtask.get('notes', [])
+            notes_to_keep = [n for n in notes if not n.startswith("UNHANDLED")]
+            if t('polling_note_approved') not in notes_to_keep:
+                notes_to_keep.append(t('polling_note_approved'))
+            subtask['notes'] = notes_to_keep
+            data_changed = True
+            desktop_notifications.append((t('notification_pr_approved_title', main_task=ticket, sub_task=format_subtask_for_title(subtask_name)), t('notification_pr_approved_body', pr_url=pr_url)))
+    else:
+        if sync_pr_comment_notes(subtask, pr_state['unhandled']):
+            data_changed = True
+
+        if pr_state['unhandled']:
+            if pr_status != 'attention_needed':
+                subtask['pr_status'] = 'attention_needed'
+                data_changed = True
+                desktop_notifications.append((t('notification_pr_unhandled_title', main_task=ticket, sub_task=format_subtask_for_title(subtask_name)), t('notification_pr_unhandled_body', pr_url=pr_url)))
+        else:
+            if pr_status == 'attention_needed':
+                subtask['pr_status'] = None
+                data_changed = True
+    return data_changed
+
+def next_pr_poll_interval(pr_state, now):
+    """
+    Seconds until a PR should be polled again, or None once it is merged or declined.
+    A PR one approval short of approved is polled at PR_POLL_MIN_SECONDS; otherwise the
+    interval grows with the time since its last activity, up to PR_POLL_MAX_SECONDS.
+    """
+    config = inc.config_manager.config
+    min_seconds = config.get("PR_POLL_MIN_SECONDS", 60)
+    max_seconds = config.get("PR_POLL_MAX_SECONDS", 3600)
+    if pr_state['state'] in ('MERGED', 'DECLINED') or pr_state['merged']:
+        return None
+    if len(pr_state['approver_ids']) == 1:
+        return min_seconds # Waiting on the second approval
+    newest_activity = pr_state['newest_activity'] / 1000
+    if not newest_activity:
+        return config.get("PR_POLL_DEFAULT_SECONDS", 300)
+    idle_seconds = max(0, now - newest_activity)
+    return min(max_seconds, max(min_seconds, idle_seconds * config.get("PR_POLL_BACKOFF_FACTOR", 0.1)))
+
+def handle_pr_webhook(event_key, pr_json):
+    """Webhook callback: the PR is polled right away, through the same path as a regular poll."""
+    api_url = dashboard_pr_api_url(pr_json)
+    if api_url:
+        with pr_poll_lock:
+            pr_webhook_events[api_url] = pr_json
+        pr_poll_wakeup.set()
+    if event_key.startswith(REVIEW_LIST_EVENTS):
+        review_poll_wakeup.set()
+
+def load_pr_sync_state():
+    """Restores the PR schedule and activity state saved by the last run, unless already in memory."""
+    schedules, states = inc.pr_sync_store.load_all()
+    with pr_poll_lock:
+        for pr_url, schedule in schedules.items():
+            pr_poll_schedule.setdefault(pr_url, schedule)
+        for pr_url, pr_state in states.items():
+            pr_activity_state.setdefault(pr_url, dict(new_pr_activity_state(), **pr_state))
+
+def poll_pull_requests(stop_event, data_lock, data_ref):
+    """
+    Polls every open PR in three phases so data_lock is never held during network I/O:
+    snapshot the PR list under the lock, fetch without it, then apply all results in one
+    short critical section. Fetches run in parallel on PR_POLL_WORKERS threads; results
+    are applied in the snapshot's order so notifications come out the same every time.
+    Each PR is only polled once its own interval is due, see next_pr_poll_interval().
+    With PR_DASHBOARD_CHANGE_DETECTION one dashboard query finds my PRs whose updatedDate
+    moved; only those get their activities fetched, the rest wait for a slow reconciliation.
+    PRs reported by the webhook listener are polled as soon as the event arrives.
+    Schedules and activity state persist across restarts, so the first cycle after a
+    start only polls what is due or changed, and never repeats a notification.
+    """
+    global pr_next_dashboard_check
     api_token = inc.config_manager.config.get("API_TOKEN")
     my_user_id = inc.config_manager.config.get("USER_ID")
+    breaker = get_breaker(STASH_PR_ENDPOINT)
+    headers = {"Authorization": f"Bearer {api_token}", "Accept": "application/json;charset=UTF-8"}
+    executor = ThreadPoolExecutor(max_workers=max(1, inc.config_manager.config.get("PR_POLL_WORKERS", 8)), thread_name_prefix="pr-poll")
+    use_dashboard = inc.config_manager.config.get("PR_DASHBOARD_CHANGE_DETECTION", True)
+    last_dashboard_time = 0
+    load_pr_sync_state()
+
+    while not stop_event.is_set():
+        # Phase 1: which PRs to poll
+        now = time.time()
+        with data_lock:
+            open_prs = [
+                (ticket, subtask_name, subtask_details.get("pr_url"))
+                for ticket, subtasks in data_ref.get("sub_tasks", {}).items() if isinstance(subtasks, dict)
+                for subtask_name, subtask_details in subtasks.items()
+                if isinstance(subtask_details, dict) and subtask_details.get("status") != "hidden"
+                and subtask_details.get("pr_url") and subtask_details.get("pr_status") != 'merged'
+                and convert_to_api_url(subtask_details.get("pr_url"))
+            ]
+        # Change detection: one dashboard query instead of two requests per PR
+        dashboard = None
+        dashboard_interval = inc.config_manager.config.get("WEBHOOK_RECONCILE_SECONDS", 1800) if webhook_active else inc.config_manager.config.get("PR_POLL_MIN_SECONDS", 60)
+        if use_dashboard and open_prs and now - last_dashboard_time >= dashboard_interval and breaker.allow_request():
+            last_dashboard_time = now
+            try:
+                dashboard = fetch_authored_prs(headers)
+                breaker.record_success()
+            except requests.exceptions.RequestException as e:
+                breaker.record_error(e)
+                print(t('polling_err', url=inc.config_manager.config.get('STASH_URL'), e=e), file=sys.stderr)
+
+        with pr_poll_lock:
+            if use_dashboard:
+                pr_next_dashboard_check = max(now, last_dashboard_time + dashboard_interval)
+            tracked_pr_urls = {pr_url for _, _, pr_url in open_prs}
+            untracked_pr_urls = (set(pr_poll_schedule) | set(pr_activity_state)) - tracked_pr_urls
+            for pr_url in untracked_pr_urls:
+                pr_poll_schedule.pop(pr_url, None)
+                pr_activity_state.pop(pr_url, None)
+            webhook_events = dict(pr_webhook_events)
+            pr_webhook_events.clear()
+            prs_to_poll = []
+            for ticket, subtask_name, pr_url in open_prs:
+                schedule = pr_poll_schedule.get(pr_url)
+                is_due = schedule is None or (schedule['next_poll'] is not None and schedule['next_poll'] <= now)
+                known_updated_date = pr_activity_state.get(pr_url, {}).get('updated_date')
+                dashboard_pr = dashboard.get(convert_to_api_url(pr_url)) if dashboard is not None else None
+                if convert_to_api_url(pr_url) in webhook_events:
+                    # The payload carries the PR itself, so only the new activities are fetched
+                    prs_to_poll.append((ticket, subtask_name, pr_url, webhook_events[convert_to_api_url(pr_url)]))
+                elif dashboard_pr is not None:
+                    if is_due or dashboard_pr.get("updatedDate") != known_updated_date:
+                        prs_to_poll.append((ticket, subtask_name, pr_url, dashboard_pr))
+                elif is_due or (dashboard is not None and known_updated_date is not None):
+                    # Dropped off the open-PR dashboard: merged or declined, find out which now
+                    prs_to_poll.append((ticket, subtask_name, pr_url, None))
+        inc.pr_sync_store.delete(untracked_pr_urls)
+
+        # Phase 2: network, no lock held; every request is started before any result is awaited
+        pending_fetches = []
+        for ticket, subtask_name, pr_url, dashboard_pr in prs_to_poll:
+            if not breaker.allow_request(): continue # Stash is failing, skip until the breaker lets a probe through
+            with pr_poll_lock:
+                known_state = dict(pr_activity_state.get(pr_url, {}))
+            pending_fetches.append((ticket, subtask_name, pr_url, dashboard_pr, fetch_pr_state(pr_url, headers, executor, known_state, dashboard_pr)))
+
+        fetched_states = []
+        sync_updates = [] # (pr_url, schedule, pr_state or None), kept only once the results are applied
+        for ticket, subtask_name, pr_url, dashboard_pr, (reviewers_future, activities_future) in pending_fetches:
+            try:
+                (reviewers, etag), new_activities = reviewers_future.result(), activities_future.result()
+                with pr_poll_lock:
+                    pr_state = copy.deepcopy(pr_activity_state.get(pr_url)) or new_pr_activity_state()
+                if merge_pr_activities(pr_state, new_activities, my_user_id):
+                    pr_state = dict(new_pr_activity_state(), etag=pr_state['etag'], pr_json=pr_state['pr_json'])
+                    merge_pr_activities(pr_state, fetch_new_pr_activities(convert_to_api_url(pr_url), headers, None), my_user_id)
+                if dashboard_pr is None:
+                    pr_state['etag'], pr_state['pr_json'] = etag, reviewers
+                pr_state['state'] = reviewers.get('state')
+                pr_state['updated_date'] = dashboard_pr.get("updatedDate") if dashboard_pr is not None else None
+                breaker.record_success()
+                fetched_states.append((ticket, subtask_name, pr_url, reviewers, pr_state))
+                interval = next_pr_poll_interval(pr_state, time.time())
+                if interval is not None and webhook_active:
+                    interval = inc.config_manager.config.get("WEBHOOK_RECONCILE_SECONDS", 1800)
+                elif interval is not None and dashboard_pr is not None and len(pr_state['approver_ids']) != 1:
+                    # The dashboard reports changes; polling it directly is just a slow reconciliation.
+                    # A PR one approval short of approved keeps its short interval.
+                    interval = inc.config_manager.config.get("PR_POLL_MAX_SECONDS", 3600)
+            except requests.exceptions.RequestException as e:
+                breaker.record_error(e)
+                print(t('polling_err', url=convert_to_api_url(pr_url), e=e), file=sys.stderr)
+                interval = inc.config_manager.config.get("PR_POLL_DEFAULT_SECONDS", 300)
+                pr_state = None
+            polled_at = time.time()
+            schedule = {'next_poll': polled_at + interval if interval is not None else None, 'interval': interval, 'last_poll': polled_at,
+                        'on_dashboard': dashboard_pr is not None}
+            sync_updates.append((pr_url, schedule, pr_state))
+
+        if stop_event.is_set():
+            # Stopped for RESTART_FOR_LOGIN: nothing fetched is kept, so the next run fetches it again for the reloaded data
+            break
 
-    while True:
+        # Phase 3: apply everything at once
+        desktop_notifications = []
         with data_lock:
             data_changed = False
-            data_copy = copy.deepcopy(data_ref)
-
-            for ticket, subtasks in data_copy.get("sub_tasks", {}).items():
-                if not isinstance(subtasks, dict): continue
-                for subtask_name, subtask_details in subtasks.items():
-                    if not isinstance(subtask_details, dict): continue
-
-                    original_subtask = data_ref["sub_tasks"][ticket][subtask_name]
-                    pr_url = original_subtask.get("pr_url")
-                    pr_status = original_subtask.get("pr_status")
-
-                    if original_subtask.get("status") == "hidden" or not pr_url or pr_status == 'merged':
-                        continue
-
-                    api_url = convert_to_api_url(pr_url)
-                    if not api_url: continue
-
-                    headers = {"Authorization": f"Bearer {api_token}", "Accept": "application/json;charset=UTF-8"}
-                    try:
-
-                        reviewers_response = requests.get(api_url, headers=headers, timeout=10)
-                        reviewers_response.raise_for_status()
-                        reviewers = reviewers_response.json()
-
-                        api_url = f"{convert_to_api_url(pr_url)}/activities"
-                        response = requests.get(api_url, headers=headers, timeout=10)
-                        response.raise_for_status()
-                        activities = response.json()
-
-                        # logging.info(activities)
-
-                        is_merged = False
-                        unique_approvers = set()
-                        for activity in activities.get("values", []):
-                            action = activity.get("action")
-                            if action == "MERGED":
-                                is_merged = True
-                                break
-                            if action == "APPROVED":
-                                approver_id = activity.get("user", {}).get("id")
-                                if approver_id:
-                                    unique_approvers.add(approver_id)
-
-
-
-
-
-                        # Format approvers
-                        approvers_formatted = []
-                        approver_count = 0
-                        total_reviewers = len(reviewers.get('reviewers', []))
-                        for r in reviewers.get('reviewers', []):
-                            status_emoji = "❓" # Not responded
-                            if r['status'] == 'APPROVED':
-                                status_emoji = "✅"
-                                approver_count += 1
-                            elif r['status'] == 'NEEDS_WORK':
-                                status_emoji = "❌"
-                            approvers_formatted.append(f"{status_emoji} {r['user']['displayName']}")
-
-                        # Determine overall status text
-                        status_text = "waiting"
-                        if activities.get('state') == 'MERGED':
-                            status_text = "merged"
-                        elif activities.get('state') == 'DECLINED':
-                            status_text = "declined"
-                        elif approver_count > 0:
-                            status_text = f"approved ({approver_count}/{total_reviewers})"
-
-                        # Store in the main data object
-
-                        original_subtask = app_data["sub_tasks"][ticket][subtask_name]
-                        original_subtask['pr_details'] = {
-                            'status_text': status_text,
-                            'approvers_formatted': approvers_formatted
-                        }
-                        data_changed = True
-
-
-
-
-
-
-                        if is_merged:
-                            if pr_status != 'merged':
-                                original_subtask['pr_status'] = 'merged'
-                                notes = original_subtask.get('notes', [])
-                                original_subtask['notes'] = [n for n in notes if not n.startswith("UNHANDLED") and not n.startswith(t('polling_note_approved'))]
-                                data_changed = True
-                                send_desktop_notification(t('notification_pr_merged_title', main_task=ticket, sub_task=format_subtask_for_title(subtask_name)), t('notification_pr_merged_body', pr_url=pr_url))
-                        elif len(unique_approvers) >= 2:
-                            if pr_status != 'approved':
-                                original_subtask['pr_status'] = 'approved'
-                                notes = original_subtask.get('notes', [])
-                                notes_to_keep = [n for n in notes if not n.startswith("UNHANDLED")]
-                                if t('polling_note_approved') not in notes_to_keep:
-                                    notes_to_keep.append(t('polling_note_approved'))
-                                original_subtask['notes'] = notes_to_keep
-                                data_changed = True
-                                send_desktop_notification(t('notification_pr_approved_title', main_task=ticket, sub_task=format_subtask_for_title(subtask_name)), t('notification_pr_approved_body', pr_url=pr_url))
-                        else:
-                            notes = original_subtask.get("notes", [])
-                            notes_without_unhandled = [n for n in notes if not n.startswith("*PR* ")]
-                            if len(notes_without_unhandled) < len(notes):
-                                original_subtask["notes"] = notes_without_unhandled
-                                data_changed = True
-
-                            unhandled_comments = check_for_unhandled_comments(activities, my_user_id)
-                            if unhandled_comments:
-                                if pr_status != 'attention_needed':
-                                    original_subtask['pr_status'] = 'attention_needed'
-                                    data_changed = True
-                                    send_desktop_notification(t('notification_pr_unhandled_title', main_task=ticket, sub_task=format_subtask_for_title(subtask_name)), t('notification_pr_unhandled_body', pr_url=pr_url))
-
-                                for comment in unhandled_comments:
-                                    note = t('polling_note_unhandled_comment', author=comment['author']['displayName'], text=comment['text'])
-                                    if note not in original_subtask["notes"]:
-                                        original_subtask["notes"].append(note)
-                                        data_changed = True
-                            else:
-                                if pr_status == 'attention_needed':
-                                    original_subtask['pr_status'] = None
-                                    data_changed = True
-
-                    except requests.exceptions.RequestException as e:
-                        print(t('polling_err', url=api_url, e=e), file=sys.stderr)
-                        pass
+            for ticket, subtask_name, pr_url, reviewers, pr_state in fetched_states:
+                subtask = data_ref.get("sub_tasks", {}).get(ticket, {}).get(subtask_name)
+                # Skip subtasks that were deleted, moved or pointed at another PR during the fetch
+                if not isinstance(subtask, dict) or subtask.get("pr_url") != pr_url:
+                    continue
+                if apply_pr_state(subtask, ticket, subtask_name, reviewers, pr_state, my_user_id, desktop_notifications):
+                    mark_changed("sub_tasks", ticket, subtask_name)
+                    data_changed = True
 
             if data_changed:
                 save_data(data_ref)
 
-        time.sleep(300)
+        with pr_poll_lock:
+            saved_states = []
+            for pr_url, schedule, pr_state in sync_updates:
+                pr_poll_schedule[pr_url] = schedule
+                if pr_state is not None: pr_activity_state[pr_url] = pr_state
+                saved_states.append((pr_url, schedule, pr_activity_state.get(pr_url)))
+        for pr_url, schedule, pr_state in saved_states:
+            inc.pr_sync_store.save(pr_url, schedule, pr_state)
+
+        for title, body in desktop_notifications:
+            send_desktop_notification(title, body)
+
+        pr_poll_wakeup.wait(PR_POLL_TICK_SECONDS)
+        pr_poll_wakeup.clear()
+    executor.shutdown(wait=False)
 
 def convert_to_api_url(pr_url):
     match = re.search(r'projects/(?P<projectKey>[^/]+)/repos/(?P<repositorySlug>[^/]+)/pull-requests/(?P<pullRequestId>\d+)', pr_url)
@@ -1728,20 +2034,43 @@ def convert_to_api_url(pr_url):
         return f"{inc.config_manager.config.get('STASH_URL')}/rest/api/1.0/projects/{parts['projectKey']}/repos/{parts['repositorySlug']}/pull-requests/{parts['pullRequestId']}"
     return None
 
-def check_for_unhandled_comments(activities, my_user_id):
-    unhandled_comments = []
-    for value in activities.get("values", []):
-        if value.get("action") == "COMMENTED":
-            comment = value.get("comment")
-            if comment and comment.get("author", {}).get("id") != my_user_id:
-                has_my_reply = False
-                for reply in comment.get("comments", []):
-                    if reply.get("author", {}).get("id") == my_user_id:
-                        has_my_reply = True
-                        break
-                if not has_my_reply:
-                    unhandled_comments.append(comment)
-    return unhandled_comments
+def has_my_reply(comment, my_user_id):
+    return any(reply.get("author", {}).get("id") == my_user_id for reply in comment.get("comments", []))
+
+def sync_pr_comment_notes(subtask, unhandled):
+    """
+    Makes the subtask's unhandled-comment notes match unhandled (see new_pr_activity_state()).
+    subtask['pr_comment_notes'] maps comment id -> {'version', 'note'} for the notes it added,
+    so only comments that appeared, changed or got handled touch the notes list. A note the
+    user deleted stays deleted until its comment is edited. Returns True if anything changed.
+    """
+    notes = subtask.setdefault("notes", [])
+    if "pr_comment_notes" not in subtask:
+        # Notes from before the index existed can't be matched to a comment; they are rebuilt once
+        subtask["notes"] = notes = [n for n in notes if not n.startswith("*PR* ")]
+        subtask["pr_comment_notes"] = {}
+    comment_notes = subtask["pr_comment_notes"]
+    changed = False
+    for comment_key in [key for key in comment_notes if key not in unhandled]:
+        _remove_note(notes, comment_notes.pop(comment_key)['note'])
+        changed = True
+    for comment_key, comment in unhandled.items():
+        known = comment_notes.get(comment_key)
+        if known is not None and known['version'] == comment['version']:
+            continue
+        if known is not None:
+            _remove_note(notes, known['note'])
+        note = t('polling_note_unhandled_comment', author=comment['author'], text=comment['text'])
+        notes.append(note)
+        comment_notes[comment_key] = {'version': comment['version'], 'note': note}
+        changed = True
+    return changed
+
+def _remove_note(notes, note):
+    try:
+        notes.remove(note)
+    except ValueError:
+        pass # Already deleted by the user
 
 def event_notification_poller(data_lock, data_ref):
     """A thread that checks for upcoming events and sends notifications."""
@@ -1855,10 +2184,45 @@ def event_notification_poller(data_lock, data_ref):
         time.sleep(60)
 
 
+def stop_pr_poller():
+    """
+    Stops the PR poller of the main() run that just returned, before its data is reloaded.
+    The in-memory PR state is dropped with it; the next poller reads it back from
+    pr_sync.db, which only holds results that were applied and saved.
+    """
+    global pr_polling_thread, pr_poll_stop_event
+    if pr_polling_thread is None:
+        return
+    pr_poll_stop_event.set()
+    pr_poll_wakeup.set()
+    pr_polling_thread.join()
+    pr_polling_thread = None
+    pr_poll_stop_event = None
+    with pr_poll_lock:
+        pr_activity_state.clear()
+        pr_poll_schedule.clear()
+
+def stop_jira_threads():
+    """
+    Stops the Jira threads of the main() run that just returned. After RESTART_FOR_LOGIN
+    they would otherwise keep taking requests from the shared queues and write into the
+    previous run's cache, while the new run starts its own.
+    """
+    global jira_stop_event, jira_threads
+    if jira_stop_event is None:
+        return
+    jira_stop_event.set()
+    for thread in jira_threads:
+        thread.join()
+    jira_stop_event = None
+    jira_threads = []
+
+
 def main(stdscr):
     global COLOR_PAIR_DEFAULT, COLOR_PAIR_REVERSE, COLOR_PAIR_GREY, COLOR_PAIR_PAUSED, COLOR_PAIR_SELECTED, COLOR_PAIR_TASK_ALL_SUBTASKS_DONE, COLOR_PAIR_TASK_ALL_SUBTASKS_HIDDEN, COLOR_PAIR_URGENT_BOX, COLOR_PAIR_PR_UNHANDLED, COLOR_PAIR_PR_APPROVED, COLOR_PAIR_FOCUSED, COLOR_PAIR_PERMANENT_NOTIFICATION, COLOR_PAIR_STANDOUT
-    global app_data, permanent_notifications
+    global app_data, permanent_notifications, webhook_active, pr_polling_thread, pr_poll_stop_event, jira_stop_event, jira_threads
     stop_event = threading.Event()
+    jira_stop_event = stop_event
     jira_cache = load_jira_cache()
     jira_cache_lock = threading.Lock()
     data_lock = threading.Lock()
@@ -1900,7 +2264,10 @@ def main(stdscr):
     stdscr.keypad(True)
 
     app_data = load_data()
-    load_jira_cache()
+    start_data_saver(data_lock)
+    set_referenced_jira_keys(collect_referenced_jira_keys(app_data))
+    prune_jira_cache(jira_cache, jira_cache_lock)
+    referenced_keys_version = data_version("sub_tasks", "paused_tasks")
 
     command_buffer = ""
 
@@ -1911,11 +2278,22 @@ def main(stdscr):
     show_help_footer = False
     current_date_for_daily_notes = date.today()
 
-    pr_polling_thread = threading.Thread(target=poll_pull_requests, args=(data_lock, app_data), daemon=True)
+    if inc.config_manager.config.get("WEBHOOK_ENABLED", False) and not webhook_active:
+        # Started once; the listener keeps running across RESTART_FOR_LOGIN
+        webhook_active = start_webhook_server(inc.config_manager.config.get("WEBHOOK_HOST", "127.0.0.1"),
+                                              inc.config_manager.config.get("WEBHOOK_PORT", 8765),
+                                              inc.config_manager.config.get("WEBHOOK_SECRET", ""),
+                                              handle_pr_webhook) is not None
+
+    pr_poll_stop_event = threading.Event()
+    pr_polling_thread = threading.Thread(target=poll_pull_requests, args=(pr_poll_stop_event, data_lock, app_data), daemon=True)
     pr_polling_thread.start()
 
-    jira_thread = threading.Thread(target=jira_queue_worker, args=(stop_event, permanent_notifications, jira_cache, jira_cache_lock), daemon=True)
-    jira_thread.start()
+    jira_threads = start_jira_workers(stop_event, permanent_notifications, jira_cache, jira_cache_lock)
+
+    jira_sync_thread = threading.Thread(target=jira_sync_worker, args=(stop_event, permanent_notifications, jira_cache, jira_cache_lock), daemon=True)
+    jira_sync_thread.start()
+    jira_threads.append(jira_sync_thread)
 
     notification_thread = threading.Thread(target=event_notification_poller, args=(data_lock, app_data), daemon=True)
     notification_thread.start()
@@ -1927,6 +2305,12 @@ def main(stdscr):
     content_refresh_interval = 10.0; last_content_refresh_time = 0.0
     request_full_redraw = True
     previous_window_size = (0,0)
+    last_render_state = None
+
+    def current_render_state():
+        # Everything a full repaint depends on besides the clock, command line and Jira cache
+        return (data_version(), current_view, selected_subtask_index, selected_note_index,
+                show_help_footer, current_date_for_daily_notes, previous_window_size)
 
     ticket_name_at_loop_start = app_data.get("current_ticket")
 
@@ -1941,7 +2325,12 @@ def main(stdscr):
         height, width = new_height, new_width
 
         with data_lock:
+            if data_version("sub_tasks", "paused_tasks") != referenced_keys_version:
+                referenced_keys_version = data_version("sub_tasks", "paused_tasks")
+                set_referenced_jira_keys(collect_referenced_jira_keys(app_data))
             ticket_name_at_loop_start = app_data.get("current_ticket")
+            if current_view == VIEW_DAILY_NOTES:
+                load_daily_notes(app_data, current_date_for_daily_notes.isoformat())
 
             completed_tickets = app_data.get("completed_tickets", [])
             current_ticket_subtasks_unfiltered = app_data.get("sub_tasks", {}).get(ticket_name_at_loop_start, {}) if ticket_name_at_loop_start else {}
@@ -1983,6 +2372,10 @@ def main(stdscr):
                         sub_name, _ = current_ticket_subtask_list_visible[selected_subtask_index]
                         entity_for_dedicated_notes = {"type": "subtask", "name": sub_name, "main_task_name": active_main_ticket}
                         current_view = VIEW_DEDICATED_NOTES
+                        jira_ticket_id = inc.helpers.get_jira_ticket_from_url(sub_name)
+                        if jira_ticket_id != sub_name:
+                            # Waits briefly (sharing any pending fetch) so the header can show the summary
+                            fetch_jira_issue(jira_ticket_id, jira_cache, jira_cache_lock)
                     elif active_main_ticket:
                         entity_for_dedicated_notes = {"type": "task", "name": active_main_ticket}
                         current_view = VIEW_DEDICATED_NOTES
@@ -2035,6 +2428,7 @@ def main(stdscr):
                                 except ValueError:
                                     next_index = 0 # Default to 'todo' if status is unknown
                                 app_data["sub_tasks"][ticket_name_at_loop_start][sub_task_name]["status"] = status_cycle[next_index]
+                                mark_changed("sub_tasks", ticket_name_at_loop_start, sub_task_name)
                                 save_data(app_data)
                                 action_processed = True
                                 request_full_redraw = True
@@ -2070,6 +2464,8 @@ def main(stdscr):
                                 if sub_task["status"] == "done" and app_data.get("focused_subtask") == sub_task_name:
                                     app_data["focused_subtask"] = None
                                     app_data["focused_ticket"] = None
+                                mark_changed("sub_tasks", main_ticket, sub_task_name)
+                                mark_changed("focused_ticket"); mark_changed("focused_subtask")
                                 save_data(app_data)
                         action_processed = True
 
@@ -2108,7 +2504,7 @@ def main(stdscr):
                             if sub_details: notes_list_size = len(sub_details.get("notes", []))
                     elif current_view == VIEW_DAILY_NOTES:
                         date_iso = current_date_for_daily_notes.isoformat()
-                        notes_list_size = len(app_data.get("daily_notes", {}).get(date_iso, []))
+                        notes_list_size = len(load_daily_notes(app_data, date_iso))
 
                 if key == curses.KEY_UP:
                     if selected_note_index > -1:
@@ -2128,12 +2524,15 @@ def main(stdscr):
                                     ent_name = entity_for_dedicated_notes.get("name")
                                     if ent_type == "task":
                                         app_data["notes"][ent_name].pop(selected_note_index)
+                                        mark_changed("notes", ent_name)
                                     elif ent_type == "subtask":
                                         main_task = entity_for_dedicated_notes.get("main_task_name")
                                         app_data["sub_tasks"][main_task][ent_name]["notes"].pop(selected_note_index)
+                                        mark_changed("sub_tasks", main_task, ent_name)
                                 elif current_view == VIEW_DAILY_NOTES:
                                     date_iso = current_date_for_daily_notes.isoformat()
-                                    app_data["daily_notes"][date_iso].pop(selected_note_index)
+                                    load_daily_notes(app_data, date_iso).pop(selected_note_index)
+                                    mark_changed("daily_notes", date_iso)
                                 save_data(app_data)
 
                             new_size = notes_list_size - 1
@@ -2148,14 +2547,18 @@ def main(stdscr):
                                 ent_name = entity_for_dedicated_notes.get("name")
                                 if ent_type == "task":
                                     app_data.setdefault("notes",{}).setdefault(ent_name,[]).append(command_buffer)
+                                    mark_changed("notes", ent_name)
                                 elif ent_type == "subtask":
                                     main_task = entity_for_dedicated_notes.get("main_task_name")
                                     sub_details = app_data.get("sub_tasks",{}).get(main_task,{}).get(ent_name)
                                     if sub_details:
                                         sub_details.setdefault("notes",[]).append(command_buffer)
+                                        mark_changed("sub_tasks", main_task, ent_name)
                             elif current_view == VIEW_DAILY_NOTES:
                                 date_iso = current_date_for_daily_notes.isoformat()
-                                app_data.setdefault("daily_notes", {}).setdefault(date_iso, []).append(command_buffer)
+                                load_daily_notes(app_data, date_iso)
+                                app_data["daily_notes"].setdefault(date_iso, []).append(command_buffer)
+                                mark_changed("daily_notes", date_iso)
                             save_data(app_data)
                     command_buffer = ""; request_full_redraw = True
                 elif key == curses.KEY_LEFT and current_view == VIEW_DAILY_NOTES:
@@ -2174,17 +2577,33 @@ def main(stdscr):
                     command_buffer = command_buffer[:-1]
                     request_full_redraw = True
 
-            # Redraw the UI after every valid keypress.
-            request_full_redraw = True
-            last_content_refresh_time = 0
+            if current_view == VIEW_DAILY_NOTES:
+                # The key may have switched the view or the date
+                with data_lock:
+                    load_daily_notes(app_data, current_date_for_daily_notes.isoformat())
+
+            # Repaint everything only when something shown changed; plain typing in the
+            # main view just redraws the clock and command line.
+            render_state = current_render_state()
+            if render_state != last_render_state:
+                request_full_redraw = True
             display_ui(stdscr, app_data, command_buffer, request_full_redraw, selected_subtask_index, current_view, entity_for_dedicated_notes, current_ticket_subtask_list_visible, show_help_footer, current_date_for_daily_notes, selected_note_index, jira_cache, jira_cache_lock)
-            if request_full_redraw : request_full_redraw = False
+            if request_full_redraw:
+                last_render_state = render_state
+                request_full_redraw = False
 
         if not user_activity_caused_draw_this_cycle:
             if current_time - last_content_refresh_time >= content_refresh_interval:
                 request_full_redraw = True
+                with data_lock:
+                    paused_jira_keys = collect_paused_jira_keys(app_data)
+                prefetch_jira_issues(paused_jira_keys, jira_cache, jira_cache_lock)
+
+            if current_render_state() != last_render_state:
+                request_full_redraw = True
 
             if request_full_redraw or (current_time - last_clock_refresh_time >= clock_refresh_interval):
+                if request_full_redraw: last_render_state = current_render_state()
                 display_ui(stdscr, app_data, command_buffer, request_full_redraw, selected_subtask_index, current_view, entity_for_dedicated_notes, current_ticket_subtask_list_visible, show_help_footer, current_date_for_daily_notes, selected_note_index, jira_cache, jira_cache_lock)
                 last_clock_refresh_time = current_time
                 if request_full_redraw:
@@ -2216,6 +2635,11 @@ if __name__ == "__main__":
             print(t('error_unexpected', e=e), file=sys.stderr)
             traceback.print_exc(file=sys.stderr)
         finally:
+            # Stop the PR poller first, its last save_data() is then written by the saver
+            stop_pr_poller()
+            # Write out any save still waiting in the persistence thread
+            stop_data_saver()
+            stop_jira_threads()
             try:
                 if 'stdscr' in locals() and 'curses' in sys.modules and not sys.modules['curses'].isendwin():
                     curses.nocbreak()